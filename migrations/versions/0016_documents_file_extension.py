@@ -0,0 +1,25 @@
+"""Add a generated documents.file_extension column and B-tree index, so the
+RAG file-type filter is an indexed equality instead of a leading-wildcard
+LIKE '%.pdf' that no B-tree can serve."""
+from alembic import op
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE documents ADD COLUMN IF NOT EXISTS file_extension TEXT "
+        "GENERATED ALWAYS AS (lower(substring(filename from '\\.[^.]+$'))) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS documents_file_extension_idx "
+        "ON documents (file_extension)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS documents_file_extension_idx")
+    op.execute("ALTER TABLE documents DROP COLUMN IF EXISTS file_extension")
@@ -0,0 +1,29 @@
+"""Add a denormalized documents.chunk_count (live chunks), backfilled here and
+maintained by insert_chunks_batch / soft_delete_chunks_for_document, so the
+document list no longer hash-aggregates every row of document_chunks."""
+from alembic import op
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE documents ADD COLUMN IF NOT EXISTS chunk_count INTEGER NOT NULL DEFAULT 0"
+    )
+    op.execute("""
+        UPDATE documents d SET chunk_count = c.n
+        FROM (
+            SELECT document_id, COUNT(*) AS n
+            FROM document_chunks
+            WHERE deleted_at IS NULL
+            GROUP BY document_id
+        ) c
+        WHERE d.id = c.document_id
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE documents DROP COLUMN IF EXISTS chunk_count")
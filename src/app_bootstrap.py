@@ -16,6 +16,8 @@ from .utils.logging_config import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
+_FATAL_BORDER = "=" * 60
+
 
 @contextlib.contextmanager
 def _preserve_root_logging() -> Iterator[None]:
@@ -110,7 +112,7 @@ def _init_ollama_service(app: Any, ollama_client: Any) -> None:
             )
             if first_model:
                 config.app_state.set_active_model(first_model)
-                logger.info(f"Active model set to: {first_model}")
+                logger.info("Active model set to: %s", first_model)
         _warmup_embedding_model(ollama_client)
     else:
         logger.warning(ollama_message)
@@ -126,14 +128,14 @@ def _warmup_embedding_model(ollama_client: Any) -> None:
     try:
         embedding_model = ollama_client.get_embedding_model()
         if embedding_model:
-            logger.info(f"Warming up embedding model: {embedding_model}...")
+            logger.info("Warming up embedding model: %s...", embedding_model)
             success, _ = ollama_client.generate_embedding(embedding_model, "warmup")
             if success:
                 logger.info("Embedding model warm-up complete")
             else:
                 logger.warning("Embedding model warm-up returned no data (non-fatal)")
     except Exception as e:
-        logger.warning(f"Embedding model warm-up failed (non-fatal): {e}")
+        logger.warning("Embedding model warm-up failed (non-fatal): %s", e)
 
 
 def _warmup_reranker() -> None:
@@ -154,7 +156,7 @@ def _warmup_reranker() -> None:
         else:
             logger.warning("Reranker warm-up: no model available (non-fatal)")
     except Exception as e:
-        logger.warning(f"Reranker warm-up failed (non-fatal): {e}")
+        logger.warning("Reranker warm-up failed (non-fatal): %s", e)
 
 
 def _init_database_service(app: Any, db: Any) -> None:
@@ -168,7 +170,7 @@ def _init_database_service(app: Any, db: Any) -> None:
         logger.info(db_message)
         _run_alembic_migrations()
         doc_count = db.get_document_count()
-        logger.info(f"Documents in database: {doc_count}")
+        logger.info("Documents in database: %s", doc_count)
         try:
             purged = db.purge_expired_tokens()
             if purged:
@@ -176,16 +178,20 @@ def _init_database_service(app: Any, db: Any) -> None:
         except Exception as _purge_err:
             logger.debug("Could not purge expired tokens: %s", _purge_err)
         return
-    logger.error(db_message)
-    logger.error("WARNING: PostgreSQL database is not available! App will run in DEGRADED MODE.")
+    logger.error(
+        "%s\nWARNING: PostgreSQL database is not available! App will run in DEGRADED MODE.",
+        db_message,
+    )
     if config.REQUIRE_DATABASE:
         logger.critical("REQUIRE_DATABASE=true - cannot start without database")
-        border = "=" * 60
-        print(f"\n{border}", file=sys.stderr)
-        print("  FATAL: PostgreSQL database is NOT available", file=sys.stderr)
-        print(f"  Reason: {db_message.splitlines()[0]}", file=sys.stderr)
-        print("  REQUIRE_DATABASE=true is set — aborting startup.", file=sys.stderr)
-        print(f"{border}\n", file=sys.stderr)
+        print(
+            f"\n{_FATAL_BORDER}\n"
+            "  FATAL: PostgreSQL database is NOT available\n"
+            f"  Reason: {db_message.splitlines()[0]}\n"
+            "  REQUIRE_DATABASE=true is set — aborting startup.\n"
+            f"{_FATAL_BORDER}\n",
+            file=sys.stderr,
+        )
         sys.exit(1)
     logger.warning("Continuing without database (development mode)")
 
@@ -207,7 +213,7 @@ def _load_plugins(app: Any) -> None:
     count = plugin_loader.load_all(plugins_dir)
     if count:
         tool_names = [t for p in plugin_loader.list_plugins() for t in p["tools"]]
-        logger.info(f"[PLUGINS] {count} plugin(s) loaded — tools: {tool_names}")
+        logger.info("[PLUGINS] %s plugin(s) loaded — tools: %s", count, tool_names)
     app.state.plugin_loader = plugin_loader
 
 
@@ -233,7 +239,7 @@ def _init_reranker_scheduler(app: Any, db: Any) -> None:
             )
             pairs = export_training_pairs(db, days=7)
             if len(pairs) < config.FEEDBACK_FINETUNE_MIN_PAIRS:
-                logger.info(f"[Reranker] {len(pairs)} pairs < minimum — skipping weekly fine-tune")
+                logger.info("[Reranker] %s pairs < minimum — skipping weekly fine-tune", len(pairs))
             else:
                 result = finetune_reranker(pairs)
                 if not result.get("skipped"):
@@ -288,7 +294,7 @@ def _seed_admin_user(db: Any) -> None:
             hashed_password=hash_user_password(admin_password),
         )
     except Exception as exc:
-        logger.warning(f"[Auth] Admin seeding skipped: {exc}")
+        logger.warning("[Auth] Admin seeding skipped: %s", exc)
         return
 
     if generated:
@@ -313,7 +319,7 @@ def _init_connectors(app: Any, db: Any, doc_processor: Any) -> None:
         app.state.connector_registry = connector_registry
         logger.info("[Connectors] Sync worker started")
     except Exception as exc:
-        logger.warning(f"[Connectors] Failed to start sync worker: {exc}", exc_info=True)
+        logger.warning("[Connectors] Failed to start sync worker: %s", exc, exc_info=True)
         app.state.sync_worker = None
         app.state.connector_registry = None
 
@@ -357,7 +363,7 @@ def _init_caching(app: Any) -> None:
         app.state.embedding_cache = embedding_cache
         app.state.query_cache = query_cache
 
-        logger.info(f"Caching initialized ({type(embedding_backend).__name__})")
+        logger.info("Caching initialized (%s)", type(embedding_backend).__name__)
 
     except Exception as e:
         if config.REDIS_ENABLED and config.REDIS_STRICT:
@@ -367,7 +373,7 @@ def _init_caching(app: Any) -> None:
                 "Fix Redis connectivity or set REDIS_STRICT=false to allow memory fallback."
             )
             sys.exit(1)
-        logger.warning(f"[!] Caching initialization failed: {e}")
+        logger.warning("[!] Caching initialization failed: %s", e)
         logger.warning("[!] Running without cache (will impact performance)")
         app.state.embedding_cache = None
         app.state.query_cache = None
@@ -378,11 +384,20 @@ def _setup_cleanup_handlers(app: Any) -> None:
     import atexit
     import signal
 
+    # A signal runs cleanup and then sys.exit, which fires the atexit hook again.
+    cleaned = threading.Event()
+
     def cleanup() -> None:
+        if cleaned.is_set():
+            return
+        cleaned.set()
         sync_worker = getattr(app.state, "sync_worker", None)
         if sync_worker is not None:
             logger.info("Stopping connector sync worker...")
             sync_worker.stop()
+        # Before the pool closes, so no queued search checks out a connection.
+        from .rag.retrieval import shutdown_executors
+        shutdown_executors()
         db = getattr(app.state, "db", None)
         if db is not None and db.is_connected:
             logger.info("Closing database connections...")
@@ -23,6 +23,10 @@ from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_ROOT_DIR = Path(__file__).parent.parent
+_STATIC_DIR = _ROOT_DIR / "static"
+_TEMPLATE_DIR = _ROOT_DIR / "templates"
+
 
 def create_app(config_override: dict[str, Any] | None = None) -> FastAPI:
     """Create and wire a FastAPI application instance (no I/O).
@@ -34,7 +38,6 @@ def create_app(config_override: dict[str, Any] | None = None) -> FastAPI:
     _cfg = config_override or {}
     testing = _cfg.get("TESTING", False)
 
-    root_dir = Path(__file__).parent.parent
     upload_folder = _cfg.get("UPLOAD_FOLDER", config.UPLOAD_FOLDER)
     os.makedirs(upload_folder, exist_ok=True)
 
@@ -57,12 +60,12 @@ def create_app(config_override: dict[str, Any] | None = None) -> FastAPI:
     app.state.cloud_client = _init_cloud_client()
     app.state.testing = testing
     app.state.upload_folder = upload_folder
-    app.state.static_folder = str(root_dir / "static")
-    app.state.template_folder = str(root_dir / "templates")
+    app.state.static_folder = str(_STATIC_DIR)
+    app.state.template_folder = str(_TEMPLATE_DIR)
 
     # Fixed catalogue of the repo's own markdown files — always present in a
     # checkout, so this loads eagerly here rather than in bootstrap_app().
-    app.state.docs_service = DocsService(root_dir=root_dir)
+    app.state.docs_service = DocsService(root_dir=_ROOT_DIR)
     if config.DOCS_ENABLED:
         app.state.docs_service.load_all()
 
@@ -86,9 +89,8 @@ def create_app(config_override: dict[str, Any] | None = None) -> FastAPI:
     _register_routers(app)
 
     # ── Static files ───────────────────────────────────────────────────────
-    static_dir = root_dir / "static"
-    if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    if _STATIC_DIR.exists():
+        app.mount("/static", StaticFiles(directory=str(_STATIC_DIR)), name="static")
 
     # ── Error handlers ─────────────────────────────────────────────────────
     _register_error_handlers(app)
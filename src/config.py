@@ -171,6 +171,15 @@ PG_DB: str = str(os.environ.get('PG_DB', 'rag_db'))
 # Connection Pool Settings
 DB_POOL_MIN_CONN: int = int(os.environ.get('DB_POOL_MIN_CONN', '2'))
 DB_POOL_MAX_CONN: int = int(os.environ.get('DB_POOL_MAX_CONN', '10'))
+# Executions of the same SQL text before psycopg prepares it server-side
+# (psycopg's default is 5; 0 prepares every statement on first use). The chunk
+# searches and chunk-context lookups pass prepare=True and are prepared on
+# first use either way.
+DB_PREPARE_THRESHOLD: int = int(os.environ.get('DB_PREPARE_THRESHOLD', '5'))
+# Planner JIT per pooled connection. Off by default: the app's queries are short
+# index lookups, and a full-table stats COUNT crossing jit_above_cost otherwise
+# pays tens of ms of LLVM compilation for no gain.
+DB_JIT: bool = os.environ.get('DB_JIT', 'False').lower() == 'true'
 
 # ============================================================================
 # OLLAMA CONFIGURATION
@@ -271,9 +280,31 @@ BATCH_MAX_WORKERS: int = 8                   # Batch processor workers
 EMBEDDING_CONCURRENT_BATCHES: int = int(os.environ.get('EMBEDDING_CONCURRENT_BATCHES', '2'))
 
 # Database Performance
-# ef_search is computed dynamically in documents.py as max(top_k * 2, 40)
-# to balance recall and query latency based on the configured TOP_K_RESULTS.
 DB_INDEX_TYPE: str = 'hnsw'                  # Use HNSW index
+# Session-wide hnsw.ef_search, set once per pooled connection. An HNSW scan
+# returns at most ef_search rows, so searches asking for more raise it with a
+# transaction-local SET instead of paying a round-trip on every query.
+HNSW_EF_SEARCH: int = int(os.environ.get('HNSW_EF_SEARCH', '100'))
+# pgvector >= 0.8 iterative index scans ('strict_order' or 'relaxed_order'; empty
+# = off). With workspace/file filters the HNSW scan keeps going until top_k rows
+# pass the filter (bounded by HNSW_MAX_SCAN_TUPLES) instead of returning fewer.
+HNSW_ITERATIVE_SCAN: str = os.environ.get('HNSW_ITERATIVE_SCAN', '').strip().lower()
+HNSW_MAX_SCAN_TUPLES: int = int(os.environ.get('HNSW_MAX_SCAN_TUPLES', '20000'))
+# Opt-in half-precision HNSW index (pgvector >= 0.7): an expression index on
+# embedding::halfvec(768) is half the size of the FP32 one, and the ANN
+# candidates (top_k * HALFVEC_RERANK_FACTOR) are re-ranked on the stored FP32
+# vectors. Stored embeddings are unchanged, so turning this off needs no migration.
+HNSW_HALFVEC_INDEX: bool = os.environ.get('HNSW_HALFVEC_INDEX', 'False').lower() == 'true'
+HALFVEC_RERANK_FACTOR: int = int(os.environ.get('HALFVEC_RERANK_FACTOR', '4'))
+# Opt-in pg_trgm GIN index on chunk_text so the debug substring search
+# (ILIKE '%x%') is an index lookup rather than a sequential scan. Off by default:
+# it roughly doubles chunk_text storage and adds GIN maintenance to every ingest.
+CHUNK_TRIGRAM_INDEX: bool = os.environ.get('CHUNK_TRIGRAM_INDEX', 'False').lower() == 'true'
+# Session settings for HNSW index builds at startup (transaction-local). Parallel
+# builds use shared memory: under Docker the db container's shm_size must cover
+# the maintenance_work_mem given here.
+HNSW_BUILD_MAINTENANCE_WORK_MEM: str = os.environ.get('HNSW_BUILD_MAINTENANCE_WORK_MEM', '512MB')
+HNSW_BUILD_PARALLEL_WORKERS: int = int(os.environ.get('HNSW_BUILD_PARALLEL_WORKERS', '3'))
 
 # L3 Database Cache Configuration
 L3_CACHE_ENABLED: bool = True                # Enable DB cache
@@ -651,12 +682,16 @@ def validate_config() -> None:
         raise ValueError(
             f"DB_POOL_MIN_CONN ({DB_POOL_MIN_CONN}) cannot exceed DB_POOL_MAX_CONN ({DB_POOL_MAX_CONN})"
         )
+    if HNSW_ITERATIVE_SCAN not in ('', 'strict_order', 'relaxed_order'):
+        raise ValueError(
+            f"HNSW_ITERATIVE_SCAN ({HNSW_ITERATIVE_SCAN!r}) must be empty, 'strict_order' or 'relaxed_order'"
+        )
     logger.debug("Configuration validation passed")
 
 
 validate_config()
 
-logger.info("Configuration module loaded")
+logger.debug("Configuration module loaded")
 logger.debug(f"Database: {PG_HOST}:{PG_PORT}/{PG_DB}")
 logger.debug(f"Chunk size: {CHUNK_SIZE}, Overlap: {CHUNK_OVERLAP}")
 logger.debug(f"Top-K results: {TOP_K_RESULTS}, Min similarity: {MIN_SIMILARITY_THRESHOLD}")
@@ -52,6 +52,6 @@ class Database(DocumentsMixin, ConversationsMixin, MemoriesMixin, EntitiesMixin,
 # Global singleton – imported throughout the application
 db = Database()
 
-logger.info("Database module loaded")
+logger.debug("Database module loaded")
 
 __all__ = ['Database', 'db', 'DatabaseUnavailableError', 'VectorLoader', 'TokensMixin']
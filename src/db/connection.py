@@ -7,7 +7,8 @@ and database/schema initialisation.
 """
 
 import socket
-from collections.abc import Generator
+import struct
+from collections.abc import Generator, Iterable, Sequence
 from contextlib import contextmanager
 from typing import Any, cast
 
@@ -15,7 +16,15 @@ import numpy as np
 import psycopg
 from psycopg import sql
 from psycopg.adapt import Dumper, Loader
-from psycopg_pool import ConnectionPool
+from psycopg.pq import Format
+from psycopg.types import TypeInfo
+from psycopg.types.json import set_json_loads
+from psycopg_pool import ConnectionPool, PoolTimeout
+
+try:
+    import orjson
+except ImportError:  # optional — psycopg then decodes json/jsonb with stdlib json
+    orjson = None  # type: ignore[assignment]
 
 from .. import config
 from ..utils.logging_config import get_logger
@@ -37,15 +46,12 @@ class MixinHost:
     """
 
     is_connected: bool = False
+    has_tsm_system_rows: bool = False
 
     @contextmanager
-    def get_connection(self) -> Generator[psycopg.Connection, None, None]:
+    def get_connection(self, read_only: bool = False) -> Generator[psycopg.Connection, None, None]:
         yield cast(psycopg.Connection, None)
 
-    @staticmethod
-    def _embedding_to_pg_array(embedding: list[float] | np.ndarray) -> str:
-        raise NotImplementedError
-
 
 # ============================================================================
 # CUSTOM EXCEPTIONS
@@ -65,14 +71,20 @@ class DatabaseUnavailableError(Exception):
 # PGVECTOR TYPE ADAPTERS FOR PSYCOPG3
 # ============================================================================
 
-class VectorDumper(Dumper):
-    """Dumper for pgvector vector type."""
+class VectorBinaryDumper(Dumper):
+    """Binary dumper for pgvector vector type.
+
+    Wire format (pgvector ``vector_send``): int16 dimension, int16 unused,
+    then one big-endian float32 per element — no text formatting on our side
+    and no float parsing on the server's. Registered for ``np.ndarray`` query
+    parameters and, by OID, for binary ``COPY`` after ``set_types``.
+    """
+
+    format = Format.BINARY
 
     def dump(self, obj: Any) -> bytes:
-        if hasattr(obj, 'tolist'):
-            obj = obj.tolist()
-        values_str = ','.join(f'{float(v):.6g}' for v in obj)
-        return f'[{values_str}]'.encode()
+        arr = np.asarray(obj, dtype='>f4')
+        return struct.pack('>HH', arr.shape[0], 0) + arr.tobytes()
 
 
 class VectorLoader(Loader):
@@ -95,12 +107,16 @@ def register_vector_types(conn) -> None:
     """Register pgvector type adapters for a connection."""
     try:
         with conn.cursor() as cur:
-            cur.execute("SELECT oid FROM pg_type WHERE typname = 'vector'")
+            cur.execute("SELECT oid, typarray FROM pg_type WHERE typname = 'vector'")
             result = cur.fetchone()
             if result:
-                vector_oid = result[0]
-                conn.adapters.register_dumper(list, VectorDumper)
-                conn.adapters.register_dumper(np.ndarray, VectorDumper)
+                vector_oid, vector_array_oid = result
+                TypeInfo('vector', vector_oid, vector_array_oid).register(conn)
+                # ndarray only: plain lists must keep psycopg's array dumper,
+                # or list params such as ``filename = ANY(%s)`` get dumped as vectors.
+                conn.adapters.register_dumper(
+                    np.ndarray, type('VectorBinaryDumper', (VectorBinaryDumper,), {'oid': vector_oid})
+                )
                 conn.adapters.register_loader(vector_oid, VectorLoader)
                 logger.debug(f"Registered pgvector type adapters (OID: {vector_oid})")
             else:
@@ -109,6 +125,30 @@ def register_vector_types(conn) -> None:
         logger.exception("Failed to register vector type adapters")
 
 
+def copy_rows_binary(
+    cursor: psycopg.Cursor,
+    table: str,
+    columns: Sequence[str],
+    types: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> None:
+    """Bulk-load ``rows`` into ``table`` with a single binary ``COPY ... FROM STDIN``.
+
+    ``types`` names the Postgres type of each column (e.g. ``'vector'``) so
+    psycopg picks the binary dumper by OID; psycopg handles the COPY header,
+    tuple framing and trailer. One statement and one stream for the whole
+    batch instead of a parse/bind/execute per row.
+    """
+    statement = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT BINARY)").format(
+        sql.Identifier(table),
+        sql.SQL(', ').join(sql.Identifier(c) for c in columns),
+    )
+    with cursor.copy(statement) as copy:
+        copy.set_types(types)
+        for row in rows:
+            copy.write_row(row)
+
+
 # ============================================================================
 # DATABASE CONNECTION CLASS
 # ============================================================================
@@ -125,6 +165,7 @@ class DatabaseConnection:
     def __init__(self) -> None:
         self.connection_pool: ConnectionPool | None = None
         self.is_connected: bool = False
+        self.has_tsm_system_rows: bool = False
         logger.info("Database manager initialized")
 
     @staticmethod
@@ -180,14 +221,6 @@ class DatabaseConnection:
                 except OSError:
                     pass
 
-    @staticmethod
-    def _embedding_to_pg_array(embedding: list[float] | np.ndarray) -> str:
-        """Convert a Python list/numpy array to a PostgreSQL vector literal."""
-        if isinstance(embedding, np.ndarray):
-            embedding = embedding.tolist()
-        values_str = ','.join(f'{float(v):.6g}' for v in embedding)
-        return f'[{values_str}]'
-
     def initialize(self) -> tuple[bool, str]:
         """
         Initialise the connection pool and create the database/schema if needed.
@@ -214,21 +247,30 @@ class DatabaseConnection:
                 "user": config.PG_USER,
                 "password": config.PG_PASSWORD,
                 "dbname": config.PG_DB,
+                "prepare_threshold": config.DB_PREPARE_THRESHOLD,
             }
 
             def configure_connection(conn: Any) -> None:
                 register_vector_types(conn)
+                if orjson is not None:
+                    # Chunk metadata comes back as jsonb on every search row.
+                    set_json_loads(orjson.loads, conn)
                 if conn.info.transaction_status != _PG_TRANSACTION_IDLE:
                     conn.rollback()
                 # Set session GUCs once per connection — avoids a round-trip on every query.
-                # ef_search=100 covers max(top_k*2, 100) for all callers; going above
-                # ef_construction (64) is capped by the index but never hurts correctness.
+                # Searches with top_k above this raise it transaction-locally.
                 conn.autocommit = True
                 with conn.cursor() as _cur:
-                    _cur.execute("SET hnsw.ef_search = 100")
+                    _cur.execute(f"SET hnsw.ef_search = {int(config.HNSW_EF_SEARCH)}")
+                    if not config.DB_JIT:
+                        _cur.execute("SET jit = off")
+                    if config.HNSW_ITERATIVE_SCAN:
+                        # Value is validated against a fixed set in config.validate_config().
+                        _cur.execute(f"SET hnsw.iterative_scan = {config.HNSW_ITERATIVE_SCAN}")
+                        _cur.execute(f"SET hnsw.max_scan_tuples = {int(config.HNSW_MAX_SCAN_TUPLES)}")
                 conn.autocommit = False
 
-            try:
+            def open_pool() -> None:
                 logger.debug("Creating connection pool")
                 self._ensure_vector_extension(_conn_kwargs)
                 self.connection_pool = ConnectionPool(
@@ -238,8 +280,12 @@ class DatabaseConnection:
                     timeout=5,
                     configure=configure_connection,
                 )
+                self._warm_pool()
                 self.is_connected = True
                 self._ensure_extensions_and_tables()
+
+            try:
+                open_pool()
                 logger.info("Database connection established successfully with pgvector type support")
                 return True, "Database connection established"
 
@@ -248,16 +294,7 @@ class DatabaseConnection:
                 if "database" in error_msg and "does not exist" in error_msg:
                     logger.warning(f"Database {config.PG_DB} doesn't exist, creating...")
                     self._create_database()
-                    self._ensure_vector_extension(_conn_kwargs)
-                    self.connection_pool = ConnectionPool(
-                        kwargs=_conn_kwargs,
-                        min_size=config.DB_POOL_MIN_CONN,
-                        max_size=config.DB_POOL_MAX_CONN,
-                        timeout=5,
-                        configure=configure_connection,
-                    )
-                    self.is_connected = True
-                    self._ensure_extensions_and_tables()
+                    open_pool()
                     logger.info("Database created and initialized successfully with pgvector type support")
                     return True, "Database created and initialized"
                 else:
@@ -290,6 +327,21 @@ class DatabaseConnection:
                 cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
         logger.debug("pgvector extension ensured before pool creation")
 
+    def _warm_pool(self, timeout: float = 10.0) -> None:
+        """Block until the pool holds ``min_size`` configured connections.
+
+        psycopg_pool connects in background workers, so without this the first
+        requests after startup each pay the TCP handshake, ``register_vector_types``
+        and the session ``SET``. A timeout is not fatal — the pool keeps filling lazily.
+        """
+        if self.connection_pool is None:
+            return
+        try:
+            self.connection_pool.wait(timeout=timeout)
+            logger.debug(f"Connection pool warmed ({config.DB_POOL_MIN_CONN} connections)")
+        except PoolTimeout:
+            logger.warning(f"Connection pool not fully warmed after {timeout:.0f}s; continuing")
+
     def _create_database(self) -> None:
         """Create the target database if it does not exist."""
         try:
@@ -327,6 +379,16 @@ class DatabaseConnection:
                 cursor.execute("CREATE EXTENSION IF NOT EXISTS vector")
                 logger.debug("pgvector extension ensured")
 
+                # Row-count table sampling for chunk statistics; a contrib module,
+                # so tolerate its absence (savepoint keeps the outer transaction alive).
+                try:
+                    with conn.transaction():
+                        cursor.execute("CREATE EXTENSION IF NOT EXISTS tsm_system_rows")
+                    self.has_tsm_system_rows = True
+                except psycopg.Error as e:
+                    self.has_tsm_system_rows = False
+                    logger.info(f"tsm_system_rows unavailable, chunk samples use TABLESAMPLE SYSTEM: {e}")
+
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS documents (
                         id SERIAL PRIMARY KEY,
@@ -351,13 +413,35 @@ class DatabaseConnection:
                 """)
                 logger.debug("Document chunks table ensured")
 
+                # HNSW builds over an existing corpus dominate a first run; give them
+                # memory and parallel workers for this DDL transaction only.
+                cursor.execute(
+                    "SELECT to_regclass('document_chunks_embedding_hnsw_idx') IS NULL,"
+                    " set_config('maintenance_work_mem', %s, true),"
+                    " set_config('max_parallel_maintenance_workers', %s, true)",
+                    (config.HNSW_BUILD_MAINTENANCE_WORK_MEM, str(config.HNSW_BUILD_PARALLEL_WORKERS)),
+                )
+                row = cursor.fetchone()
+                building_hnsw = bool(row and row[0])
+
                 cursor.execute("""
                     CREATE INDEX IF NOT EXISTS document_chunks_embedding_hnsw_idx
                     ON document_chunks USING hnsw (embedding vector_cosine_ops)
                     WITH (m = 16, ef_construction = 64)
                 """)
+                if building_hnsw:
+                    # Fresh statistics so the planner costs the new index correctly.
+                    cursor.execute("ANALYZE document_chunks")
                 logger.debug("HNSW vector similarity index ensured")
 
+                if config.HNSW_HALFVEC_INDEX:
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS document_chunks_embedding_halfvec_hnsw_idx
+                        ON document_chunks USING hnsw ((embedding::halfvec(768)) halfvec_cosine_ops)
+                        WITH (m = 16, ef_construction = 64)
+                    """)
+                    logger.debug("Half-precision HNSW index ensured")
+
                 cursor.execute("""
                     CREATE INDEX IF NOT EXISTS document_chunks_document_id_idx
                     ON document_chunks (document_id)
@@ -382,6 +466,33 @@ class DatabaseConnection:
                 """)
                 logger.debug("Full-text search column and GIN index ensured")
 
+                if config.CHUNK_TRIGRAM_INDEX:
+                    # pg_trgm is a contrib module; a savepoint keeps its absence
+                    # from aborting the rest of the schema setup.
+                    try:
+                        with conn.transaction():
+                            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                            cursor.execute("""
+                                CREATE INDEX IF NOT EXISTS document_chunks_text_trgm_idx
+                                ON document_chunks USING GIN (chunk_text gin_trgm_ops)
+                            """)
+                        logger.debug("Chunk text trigram index ensured")
+                    except psycopg.Error as e:
+                        logger.warning(f"CHUNK_TRIGRAM_INDEX set but pg_trgm is unavailable: {e}")
+
+                # Extension filter as an indexed equality instead of a leading-wildcard
+                # LIKE '%.pdf', which no B-tree can serve.
+                cursor.execute("""
+                    ALTER TABLE documents
+                    ADD COLUMN IF NOT EXISTS file_extension TEXT
+                    GENERATED ALWAYS AS (lower(substring(filename from '\\.[^.]+$'))) STORED
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS documents_file_extension_idx
+                    ON documents (file_extension)
+                """)
+                logger.debug("Document file extension column and index ensured")
+
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS conversations (
                         id UUID PRIMARY KEY,
@@ -661,13 +772,18 @@ class DatabaseConnection:
                 logger.info("All database extensions and tables verified")
 
     @contextmanager
-    def get_connection(self) -> Generator[psycopg.Connection, None, None]:
+    def get_connection(self, read_only: bool = False) -> Generator[psycopg.Connection, None, None]:
         """
         Yield a connection from the pool.
 
         Commits on clean exit, rolls back on exception, always returns
         the connection to the pool.
 
+        Args:
+            read_only: Run the block in autocommit, so plain SELECTs need no
+                BEGIN/COMMIT round-trip. Statements that must share a transaction
+                open one explicitly with ``conn.transaction()``.
+
         Raises:
             DatabaseUnavailableError: If the connection pool is not initialised.
         """
@@ -678,6 +794,8 @@ class DatabaseConnection:
             )
         connection = self.connection_pool.getconn()
         try:
+            if read_only:
+                connection.autocommit = True
             yield connection
             if connection.info.transaction_status == _PG_TRANSACTION_INTRANS:
                 connection.commit()
@@ -686,6 +804,10 @@ class DatabaseConnection:
             logger.debug(f"Transaction rolled back: {e}")
             raise
         finally:
+            # Skipped when the autocommit switch itself failed, so a broken or
+            # mid-transaction connection still goes back to the pool.
+            if read_only and not connection.closed and connection.autocommit:
+                connection.autocommit = False
             self.connection_pool.putconn(connection)
 
     def close(self) -> None:
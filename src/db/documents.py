@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from psycopg.types.json import Jsonb
 
+from .. import config
 from ..utils.encryption import encrypt as _encrypt
 from ..utils.logging_config import get_logger
 from ..utils.sanitization import escape_sql_like
-from .connection import DatabaseUnavailableError
+from .connection import DatabaseUnavailableError, copy_rows_binary
 
 if TYPE_CHECKING:
     import psycopg
@@ -19,6 +23,9 @@ else:
 
 logger = get_logger(__name__)
 
+# Rows read by the approximate chunk-statistics path (TABLESAMPLE SYSTEM_ROWS).
+_STATS_SAMPLE_ROWS = 1000
+
 
 class DocumentsMixin(MixinHost):
     """Mixin that adds document and chunk operations to the Database class."""
@@ -46,7 +53,7 @@ class DocumentsMixin(MixinHost):
         filename = filename.replace('\x00', '')
         content = content.replace('\x00', '')
 
-        logger.debug(f"Inserting document: {filename}")
+        logger.debug("Inserting document: %s", filename)
 
         def _insert(cursor: Any) -> int:
             cursor.execute(
@@ -123,14 +130,17 @@ class DocumentsMixin(MixinHost):
         """Retire all live chunks of a document ahead of inserting its replacement
         set — used when re-ingesting changed content under the same document id.
         Rows are kept (not DELETEd) so existing citations still resolve.
+        The document's denormalized ``chunk_count`` is reset in the same statement.
 
         Pass ``conn`` to run as part of a caller-owned transaction.
         """
         def _retire(cursor: Any) -> None:
             cursor.execute(
-                "UPDATE document_chunks SET deleted_at = NOW()"
-                " WHERE document_id = %s AND deleted_at IS NULL",
-                (doc_id,),
+                "WITH retired AS ("
+                " UPDATE document_chunks SET deleted_at = NOW()"
+                " WHERE document_id = %s AND deleted_at IS NULL)"
+                " UPDATE documents SET chunk_count = 0 WHERE id = %s",
+                (doc_id, doc_id),
             )
 
         if conn is not None:
@@ -171,7 +181,7 @@ class DocumentsMixin(MixinHost):
         """
         if not self.is_connected:
             return []
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     "SELECT id, chunk_text FROM document_chunks WHERE document_id = %s",
@@ -241,6 +251,7 @@ class DocumentsMixin(MixinHost):
     ) -> list[int]:
         """Accepts ``(doc_id, chunk_text, chunk_index, embedding)`` tuples or equivalent dicts with optional metadata.
 
+        Also bumps each document's denormalized ``chunk_count``.
         Pass ``conn`` to run as part of a caller-owned transaction.
         """
         if not chunks_data:
@@ -249,16 +260,10 @@ class DocumentsMixin(MixinHost):
         if conn is None and not self.is_connected:
             raise DatabaseUnavailableError("Cannot insert chunks: Database is not connected")
 
-        logger.debug(f"Inserting batch of {len(chunks_data)} chunks")
+        logger.debug("Inserting batch of %s chunks", len(chunks_data))
 
         # Pre-process all rows outside the DB connection to keep CPU work
         # separate from network I/O.
-        insert_sql = (
-            "INSERT INTO document_chunks"
-            " (document_id, chunk_text, chunk_index, embedding, metadata)"
-            " VALUES (%s, %s, %s, %s::vector, %s)"
-            " RETURNING id"
-        )
         rows = []
         for chunk in chunks_data:
             if isinstance(chunk, dict):
@@ -274,31 +279,99 @@ class DocumentsMixin(MixinHost):
                 doc_id,
                 chunk_text.replace('\x00', ''),
                 chunk_index,
-                self._embedding_to_pg_array(embedding),
+                np.asarray(embedding, dtype=np.float32),
                 Jsonb(metadata),
             ))
 
-        # Pipeline mode batches all INSERT statements in one round-trip.
-        # RETURNING id is collected after the pipeline flushes.
-        def _insert_all(active_conn: psycopg.Connection, cursor: Any) -> list[int]:
-            with active_conn.pipeline():
-                for row in rows:
-                    cursor.execute(insert_sql, row)
-            # Fetch RETURNING results after pipeline flush (outside pipeline block).
-            return [r[0] for r in cursor.fetchall()]
+        # COPY has no RETURNING, so ids are drawn from the SERIAL sequence up
+        # front (one round-trip for the whole batch) and supplied explicitly;
+        # the rows then stream in a single binary COPY.
+        def _insert_all(cursor: Any) -> list[int]:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence('document_chunks', 'id'))"
+                " FROM generate_series(1, %s)",
+                (len(rows),),
+            )
+            ids = [r[0] for r in cursor.fetchall()]
+            copy_rows_binary(
+                cursor,
+                'document_chunks',
+                ['id', 'document_id', 'chunk_text', 'chunk_index', 'embedding', 'metadata'],
+                ['int4', 'int4', 'text', 'int4', 'vector', 'jsonb'],
+                ((chunk_id, *row) for chunk_id, row in zip(ids, rows, strict=True)),
+            )
+            per_doc = Counter(row[0] for row in rows)
+            cursor.execute(
+                "UPDATE documents d SET chunk_count = d.chunk_count + c.n"
+                " FROM unnest(%s::int[], %s::int[]) AS c(id, n) WHERE d.id = c.id",
+                (list(per_doc), list(per_doc.values())),
+            )
+            return ids
 
         chunk_ids: list[int]
         if conn is not None:
             with conn.cursor() as cursor:
-                chunk_ids = _insert_all(conn, cursor)
+                chunk_ids = _insert_all(cursor)
         else:
             with self.get_connection() as owned_conn:
                 with owned_conn.cursor() as cursor:
-                    chunk_ids = _insert_all(owned_conn, cursor)
+                    chunk_ids = _insert_all(cursor)
                 owned_conn.commit()
         logger.info(f"Successfully inserted {len(chunks_data)} chunks")
         return chunk_ids
 
+    @staticmethod
+    @contextmanager
+    def _ef_search_scope(conn: psycopg.Connection, top_k: int) -> Iterator[None]:
+        """Raise ``hnsw.ef_search`` for the enclosed statements when ``top_k`` exceeds
+        the session value.
+
+        The session default is set once per connection in ``configure_connection``,
+        so the common case issues no extra statement. Searches run on read-only
+        (autocommit) connections, so the transaction-local override gets an explicit
+        transaction around it.
+        """
+        if top_k <= config.HNSW_EF_SEARCH:
+            yield
+            return
+        with conn.transaction():
+            conn.execute("SELECT set_config('hnsw.ef_search', %s, true)", (str(top_k),))
+            yield
+
+    @staticmethod
+    def _knn_sql(select_sql: str) -> str:
+        """Wrap a ``SELECT ... CROSS JOIN q WHERE ...`` chunk query in the query-vector
+        CTE plus nearest-neighbour ``ORDER BY ... LIMIT %s``.
+
+        With ``HNSW_HALFVEC_INDEX`` the ANN step walks the half-precision expression
+        index and the candidates are re-ranked on the stored FP32 ``similarity``
+        column, which costs a second ``LIMIT %s`` (see ``_knn_limits``).
+        """
+        if not config.HNSW_HALFVEC_INDEX:
+            return (
+                "WITH q AS (SELECT %s::vector AS emb)\n"
+                f"{select_sql}\n"
+                "ORDER BY dc.embedding <=> q.emb\n"
+                "LIMIT %s"
+            )
+        return (
+            "WITH q AS (SELECT %s::vector AS emb)\n"
+            "SELECT * FROM (\n"
+            f"{select_sql}\n"
+            "ORDER BY dc.embedding::halfvec(768) <=> q.emb::halfvec(768)\n"
+            "LIMIT %s\n"
+            ") candidates\n"
+            "ORDER BY similarity DESC\n"
+            "LIMIT %s"
+        )
+
+    @staticmethod
+    def _knn_limits(top_k: int) -> list[int]:
+        """``LIMIT`` parameters matching ``_knn_sql``."""
+        if not config.HNSW_HALFVEC_INDEX:
+            return [top_k]
+        return [top_k * config.HALFVEC_RERANK_FACTOR, top_k]
+
     def search_similar_chunks(
         self,
         query_embedding: list[float] | np.ndarray,
@@ -313,51 +386,53 @@ class DocumentsMixin(MixinHost):
         if not self.is_connected:
             raise DatabaseUnavailableError("Cannot search chunks: Database is not connected")
 
-        logger.debug(f"Searching for top {top_k} similar chunks (min_similarity={min_similarity})")
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                embedding_str = self._embedding_to_pg_array(query_embedding)
-                max_distance = 1.0 - min_similarity  # cosine distance = 1 - similarity
+        logger.debug("Searching for top %s similar chunks (min_similarity=%s)", top_k, min_similarity)
+        with self.get_connection(read_only=True) as conn:
+            with self._ef_search_scope(conn, max(self._knn_limits(top_k))), conn.cursor() as cursor:
+                query_vector = np.asarray(query_embedding, dtype=np.float32)
+                # cosine distance = 1 - similarity. The distance predicate also drops
+                # NULL embeddings (NULL <= x is not true), so no IS NOT NULL filter is
+                # needed to keep the plan on document_chunks_embedding_hnsw_idx.
+                max_distance = 1.0 - min_similarity
 
                 where_extra = ""
-                params: list = [embedding_str]
+                params: list = [query_vector]
                 if file_type_filter:
-                    where_extra += "  AND d.filename LIKE %s\n"
-                    params.append(f'%{file_type_filter}')
-                    logger.debug(f"Searching with file type filter: {file_type_filter}")
+                    where_extra += "  AND d.file_extension = %s\n"
+                    params.append(file_type_filter.lower())
+                    logger.debug("Searching with file type filter: %s", file_type_filter)
                 if filename_filter:
                     where_extra += "  AND d.filename = ANY(%s)\n"
                     params.append(filename_filter)
-                    logger.debug(f"Searching with filename filter: {len(filename_filter)} file(s)")
+                    logger.debug("Searching with filename filter: %s file(s)", len(filename_filter))
                 if workspace_id:
                     where_extra += "  AND d.workspace_id = %s\n"
                     params.append(workspace_id)
                 if source_ids:
                     where_extra += "  AND d.source_id = ANY(%s)\n"
                     params.append(source_ids)
-                params.extend([max_distance, top_k])
+                params.append(max_distance)
+                params.extend(self._knn_limits(top_k))
 
                 cursor.execute(
-                    f"""
-                    WITH q AS (SELECT %s::vector AS emb)
+                    self._knn_sql(f"""
                     SELECT dc.chunk_text, d.filename, dc.chunk_index,
                            1 - (dc.embedding <=> q.emb) AS similarity,
                            dc.metadata, dc.id
                     FROM document_chunks dc
                     JOIN documents d ON dc.document_id = d.id
                     CROSS JOIN q
-                    WHERE dc.embedding IS NOT NULL
-                      AND dc.deleted_at IS NULL
+                    WHERE dc.deleted_at IS NULL
                       AND d.deleted_at IS NULL
-                    {where_extra}  AND (dc.embedding <=> q.emb) <= %s
-                    ORDER BY dc.embedding <=> q.emb
-                    LIMIT %s
-                    """,
+                    {where_extra}  AND (dc.embedding <=> q.emb) <= %s"""),
                     params,
+                    # Server-side prepare from the first call: the SQL text is one of a
+                    # handful of filter variants, so the plan is reused across searches.
+                    prepare=True,
                 )
 
                 results = cursor.fetchall()
-                logger.debug(f"Found {len(results)} similar chunks")
+                logger.debug("Found %s similar chunks", len(results))
                 return [(r[0], r[1], r[2], r[3], r[4] or {}, r[5]) for r in results]
 
     def search_lexical_chunks(
@@ -384,14 +459,14 @@ class DocumentsMixin(MixinHost):
         if not query or not query.strip():
             return []
 
-        logger.debug(f"Lexical search for top {top_k} chunks")
-        with self.get_connection() as conn:
+        logger.debug("Lexical search for top %s chunks", top_k)
+        with self.get_connection(read_only=True) as conn:
             with conn.cursor() as cursor:
                 where_extra = ""
                 params: list = [query]
                 if file_type_filter:
-                    where_extra += "  AND d.filename LIKE %s\n"
-                    params.append(f'%{file_type_filter}')
+                    where_extra += "  AND d.file_extension = %s\n"
+                    params.append(file_type_filter.lower())
                 if filename_filter:
                     where_extra += "  AND d.filename = ANY(%s)\n"
                     params.append(filename_filter)
@@ -420,10 +495,11 @@ class DocumentsMixin(MixinHost):
                     LIMIT %s
                     """,
                     params,
+                    prepare=True,
                 )
 
                 results = cursor.fetchall()
-                logger.debug(f"Found {len(results)} lexical matches")
+                logger.debug("Found %s lexical matches", len(results))
                 return [(r[0], r[1], r[2], r[3], r[4] or {}, r[5]) for r in results]
 
     def search_similar_chunks_with_scores(
@@ -437,52 +513,35 @@ class DocumentsMixin(MixinHost):
         if not self.is_connected:
             raise DatabaseUnavailableError("Cannot search chunks: Database is not connected")
 
-        logger.debug(f"Searching for top {top_k} similar chunks (min_sim={min_similarity})")
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                embedding_str = self._embedding_to_pg_array(query_embedding)
+        logger.debug("Searching for top %s similar chunks (min_sim=%s)", top_k, min_similarity)
+        with self.get_connection(read_only=True) as conn:
+            with self._ef_search_scope(conn, max(self._knn_limits(top_k))), conn.cursor() as cursor:
+                query_vector = np.asarray(query_embedding, dtype=np.float32)
                 max_distance = 1.0 - min_similarity
 
+                where_extra = "  AND d.file_extension = %s\n" if file_type_filter else ""
+                params: list = [query_vector]
                 if file_type_filter:
-                    cursor.execute(
-                        """
-                        WITH q AS (SELECT %s::vector AS emb)
-                        SELECT dc.chunk_text, d.filename, dc.chunk_index,
-                               1 - (dc.embedding <=> q.emb) AS similarity,
-                               dc.document_id
-                        FROM document_chunks dc
-                        JOIN documents d ON dc.document_id = d.id
-                        CROSS JOIN q
-                        WHERE dc.embedding IS NOT NULL
-                          AND d.deleted_at IS NULL
-                          AND d.filename LIKE %s
-                          AND (dc.embedding <=> q.emb) <= %s
-                        ORDER BY dc.embedding <=> q.emb
-                        LIMIT %s
-                        """,
-                        (embedding_str, f'%{file_type_filter}', max_distance, top_k),
-                    )
-                else:
-                    cursor.execute(
-                        """
-                        WITH q AS (SELECT %s::vector AS emb)
-                        SELECT dc.chunk_text, d.filename, dc.chunk_index,
-                               1 - (dc.embedding <=> q.emb) AS similarity,
-                               dc.document_id
-                        FROM document_chunks dc
-                        JOIN documents d ON dc.document_id = d.id
-                        CROSS JOIN q
-                        WHERE dc.embedding IS NOT NULL
-                          AND d.deleted_at IS NULL
-                          AND (dc.embedding <=> q.emb) <= %s
-                        ORDER BY dc.embedding <=> q.emb
-                        LIMIT %s
-                        """,
-                        (embedding_str, max_distance, top_k),
-                    )
+                    params.append(file_type_filter.lower())
+                params.append(max_distance)
+                params.extend(self._knn_limits(top_k))
+
+                cursor.execute(
+                    self._knn_sql(f"""
+                    SELECT dc.chunk_text, d.filename, dc.chunk_index,
+                           1 - (dc.embedding <=> q.emb) AS similarity,
+                           dc.document_id
+                    FROM document_chunks dc
+                    JOIN documents d ON dc.document_id = d.id
+                    CROSS JOIN q
+                    WHERE d.deleted_at IS NULL
+                    {where_extra}  AND (dc.embedding <=> q.emb) <= %s"""),
+                    params,
+                    prepare=True,
+                )
 
                 results = cursor.fetchall()
-                logger.debug(f"Found {len(results)} chunks above similarity threshold {min_similarity}")
+                logger.debug("Found %s chunks above similarity threshold %s", len(results), min_similarity)
                 return results
 
     def get_adjacent_chunks(
@@ -492,9 +551,10 @@ class DocumentsMixin(MixinHost):
             raise DatabaseUnavailableError("Cannot get adjacent chunks: Database is not connected")
 
         logger.debug(
-            f"Getting adjacent chunks for doc {document_id}, chunk {chunk_index}, window {window_size}"
+            "Getting adjacent chunks for doc %s, chunk %s, window %s",
+            document_id, chunk_index, window_size,
         )
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     """
@@ -505,16 +565,17 @@ class DocumentsMixin(MixinHost):
                     ORDER BY chunk_index
                     """,
                     (document_id, chunk_index - window_size, chunk_index + window_size),
+                    prepare=True,
                 )
                 results = cursor.fetchall()
-                logger.debug(f"Retrieved {len(results)} adjacent chunks")
+                logger.debug("Retrieved %s adjacent chunks", len(results))
                 return results
 
     def get_chunk_by_id(self, chunk_id: int) -> dict[str, Any] | None:
         if not self.is_connected:
             raise DatabaseUnavailableError("Cannot get chunk: Database is not connected")
 
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     "SELECT id, document_id, chunk_index, chunk_text, metadata"
@@ -532,6 +593,43 @@ class DocumentsMixin(MixinHost):
             'metadata': row[4] or {},
         }
 
+    def get_chunk_context(self, chunk_id: int, window_size: int = 1) -> dict[str, Any] | None:
+        """``get_chunk_by_id`` + ``get_adjacent_chunks`` in one round trip.
+
+        Returns ``{'document_id', 'chunk_index', 'chunks': [(chunk_text, chunk_index), ...]}``,
+        or None when the chunk does not exist. Neighbours come from a LATERAL
+        lookup on the ``(document_id, chunk_index)`` index.
+        """
+        if not self.is_connected:
+            raise DatabaseUnavailableError("Cannot get chunk context: Database is not connected")
+
+        with self.get_connection(read_only=True) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT c.document_id, c.chunk_index, n.chunk_text, n.chunk_index
+                    FROM document_chunks c
+                    LEFT JOIN LATERAL (
+                        SELECT chunk_text, chunk_index
+                        FROM document_chunks
+                        WHERE document_id = c.document_id
+                          AND chunk_index BETWEEN c.chunk_index - %s AND c.chunk_index + %s
+                    ) n ON true
+                    WHERE c.id = %s
+                    ORDER BY n.chunk_index
+                    """,
+                    (window_size, window_size, chunk_id),
+                    prepare=True,
+                )
+                rows = cursor.fetchall()
+        if not rows:
+            return None
+        return {
+            'document_id': rows[0][0],
+            'chunk_index': rows[0][1],
+            'chunks': [(r[2], r[3]) for r in rows if r[2] is not None],
+        }
+
     def get_document_count(self, workspace_id: str | None = None) -> int:
         """Return the number of documents, optionally scoped to a workspace."""
         if not self.is_connected:
@@ -549,7 +647,7 @@ class DocumentsMixin(MixinHost):
                 row = cursor.fetchone()
                 assert row is not None, "SELECT COUNT(*) always returns a row"
                 count = row[0]
-                logger.debug(f"Document count: {count}")
+                logger.debug("Document count: %s", count)
                 return count
 
     def get_chunk_count(self, workspace_id: str | None = None) -> int:
@@ -579,9 +677,37 @@ class DocumentsMixin(MixinHost):
                 row = cursor.fetchone()
                 assert row is not None, "SELECT COUNT(*) always returns a row"
                 count = row[0]
-                logger.debug(f"Chunk count: {count}")
+                logger.debug("Chunk count: %s", count)
                 return count
 
+    def get_database_stats(self, workspace_id: str | None = None) -> dict[str, int]:
+        """Return ``{'document_count', 'chunk_count'}`` in one round-trip.
+
+        Both counts come from the same statement, so they share a snapshot.
+        ``workspace_id`` scopes them as in ``get_document_count``.
+        """
+        if not self.is_connected:
+            raise DatabaseUnavailableError("Cannot get database stats: Database is not connected")
+
+        scope = "AND d.workspace_id = %s" if workspace_id else ""
+        sql = f"""
+            SELECT
+                (SELECT COUNT(*) FROM documents d WHERE d.deleted_at IS NULL {scope}),
+                (SELECT COUNT(*) FROM document_chunks dc
+                 JOIN documents d ON dc.document_id = d.id
+                 WHERE d.deleted_at IS NULL {scope})
+        """
+        params = (workspace_id, workspace_id) if workspace_id else ()
+
+        with self.get_connection(read_only=True) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+        assert row is not None, "scalar subqueries always return a row"
+        stats = {'document_count': row[0] or 0, 'chunk_count': row[1] or 0}
+        logger.debug("Database stats: %s", stats)
+        return stats
+
     def get_all_documents(self, workspace_id: str | None = None) -> list[dict[str, Any]]:
         """List documents (id, filename, created_at, chunk_count), optionally scoped to a workspace."""
         if not self.is_connected:
@@ -590,22 +716,19 @@ class DocumentsMixin(MixinHost):
         logger.debug("Getting all documents")
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
+                # chunk_count is maintained on write, so listing never touches document_chunks.
                 if workspace_id:
                     cursor.execute("""
-                        SELECT d.id, d.filename, d.created_at, COUNT(dc.id) AS chunk_count
+                        SELECT d.id, d.filename, d.created_at, d.chunk_count
                         FROM documents d
-                        LEFT JOIN document_chunks dc ON d.id = dc.document_id
                         WHERE d.workspace_id = %s AND d.deleted_at IS NULL
-                        GROUP BY d.id, d.filename, d.created_at
                         ORDER BY d.created_at DESC
                     """, (workspace_id,))
                 else:
                     cursor.execute("""
-                        SELECT d.id, d.filename, d.created_at, COUNT(dc.id) AS chunk_count
+                        SELECT d.id, d.filename, d.created_at, d.chunk_count
                         FROM documents d
-                        LEFT JOIN document_chunks dc ON d.id = dc.document_id
                         WHERE d.deleted_at IS NULL
-                        GROUP BY d.id, d.filename, d.created_at
                         ORDER BY d.created_at DESC
                     """)
                 rows = cursor.fetchall()
@@ -618,7 +741,7 @@ class DocumentsMixin(MixinHost):
                     }
                     for row in rows
                 ]
-                logger.debug(f"Retrieved {len(documents)} documents")
+                logger.debug("Retrieved %s documents", len(documents))
                 return documents
 
     def document_exists(
@@ -635,16 +758,14 @@ class DocumentsMixin(MixinHost):
         if not self.is_connected:
             raise DatabaseUnavailableError("Cannot check document existence: Database is not connected")
 
-        logger.debug(f"Checking if document exists: {filename} (workspace={workspace_id})")
+        logger.debug("Checking if document exists: %s (workspace=%s)", filename, workspace_id)
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute("""
-                    SELECT d.id, d.created_at, COUNT(dc.id) AS chunk_count, d.content_hash
+                    SELECT d.id, d.created_at, d.chunk_count, d.content_hash
                     FROM documents d
-                    LEFT JOIN document_chunks dc ON d.id = dc.document_id AND dc.deleted_at IS NULL
                     WHERE d.filename = %s AND d.deleted_at IS NULL
                       AND d.workspace_id IS NOT DISTINCT FROM %s
-                    GROUP BY d.id, d.created_at, d.content_hash
                 """, (filename, workspace_id))
                 row = cursor.fetchone()
                 if row:
@@ -654,106 +775,147 @@ class DocumentsMixin(MixinHost):
                         'chunk_count': row[2],
                         'content_hash': row[3],
                     }
-                    logger.debug(f"Document exists: {filename} (ID: {row[0]})")
+                    logger.debug("Document exists: %s (ID: %s)", filename, row[0])
                     return True, doc_info
-                logger.debug(f"Document does not exist: {filename}")
+                logger.debug("Document does not exist: %s", filename)
                 return False, {}
 
-    def get_chunk_statistics(self) -> dict[str, Any]:
-        """Return statistics about chunks (totals, embedding coverage, samples)."""
+    def get_chunk_statistics(self, exact: bool = True) -> dict[str, Any]:
+        """Return statistics about chunks (totals, embedding coverage, samples).
+
+        ``exact=False`` (needs ``tsm_system_rows``) computes the aggregates over a
+        fixed-size row sample and scales them to the planner's row estimate, so
+        the cost no longer grows with the table; ``approximate`` in the result
+        says whether that happened. Tables smaller than the sample stay exact.
+        """
         if not self.is_connected:
             raise DatabaseUnavailableError("Cannot get chunk statistics: Database is not connected")
 
         logger.debug("Getting chunk statistics")
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT COUNT(*) AS total,
-                           COUNT(embedding) AS with_embeddings,
-                           AVG(LENGTH(chunk_text)) AS avg_length
-                    FROM document_chunks
-                """)
-                row = cursor.fetchone()
-                assert row is not None, "SELECT COUNT(*)/AVG(...) always returns a row"
-                total = row[0]
-                with_embeddings = row[1]
-                avg_length = float(row[2]) if row[2] else 0.0
-
-                cursor.execute("""
-                    SELECT d.filename, dc.chunk_index, dc.chunk_text,
+        sampled = not exact and self.has_tsm_system_rows
+        if sampled:
+            counts_sql = f"""
+                SELECT COUNT(*), COUNT(embedding), AVG(LENGTH(chunk_text)),
+                       (SELECT reltuples::bigint FROM pg_class
+                        WHERE oid = to_regclass('document_chunks'))
+                FROM document_chunks TABLESAMPLE SYSTEM_ROWS({_STATS_SAMPLE_ROWS})
+            """
+        else:
+            counts_sql = """
+                SELECT COUNT(*) AS total,
+                       COUNT(embedding) AS with_embeddings,
+                       AVG(LENGTH(chunk_text)) AS avg_length
+                FROM document_chunks
+            """
+        # SYSTEM_ROWS reads a fixed number of rows however small the table;
+        # SYSTEM(1) picks ~1% of pages and often returns nothing below ~100 pages.
+        # Over-sample so the join cannot starve the three samples.
+        sample = "SYSTEM_ROWS(30)" if self.has_tsm_system_rows else "SYSTEM(1)"
+        with self.get_connection(read_only=True) as conn:
+            # Both statements go out in one pipeline: one round-trip, not two.
+            with conn.pipeline(), conn.cursor() as counts_cur, conn.cursor() as sample_cur:
+                counts_cur.execute(counts_sql)
+                sample_cur.execute(f"""
+                    SELECT d.filename, dc.chunk_index, LEFT(dc.chunk_text, 200) AS preview,
                            LENGTH(dc.chunk_text) AS length,
                            dc.embedding IS NOT NULL AS has_embedding
-                    FROM document_chunks dc TABLESAMPLE SYSTEM(1)
+                    FROM document_chunks dc TABLESAMPLE {sample}
                     JOIN documents d ON dc.document_id = d.id
                     LIMIT 3
                 """)
-                samples = [
-                    {
-                        'filename': r[0],
-                        'chunk_index': r[1],
-                        'preview': r[2][:200] + '...' if len(r[2]) > 200 else r[2],
-                        'length': r[3],
-                        'has_embedding': r[4],
-                    }
-                    for r in cursor.fetchall()
-                ]
-
-                stats = {
-                    'total_chunks': total,
-                    'chunks_with_embeddings': with_embeddings,
-                    'chunks_without_embeddings': total - with_embeddings,
-                    'avg_chunk_length': round(avg_length, 2),
-                    'sample_chunks': samples,
-                }
-                logger.info(f"Chunk statistics: {total} total, {with_embeddings} with embeddings")
-                return stats
+                row = counts_cur.fetchone()
+                sample_rows = sample_cur.fetchall()
+
+        assert row is not None, "SELECT COUNT(*)/AVG(...) always returns a row"
+        total = row[0]
+        with_embeddings = row[1]
+        avg_length = float(row[2]) if row[2] else 0.0
+        # A sample smaller than requested means it covered the whole table.
+        approximate = sampled and total >= _STATS_SAMPLE_ROWS
+        if approximate:
+            estimated_total = max(row[3] or 0, total)
+            with_embeddings = round(with_embeddings * estimated_total / total)
+            total = estimated_total
+        samples = [
+            {
+                'filename': r[0],
+                'chunk_index': r[1],
+                'preview': r[2] + '...' if r[3] > 200 else r[2],
+                'length': r[3],
+                'has_embedding': r[4],
+            }
+            for r in sample_rows
+        ]
+
+        stats = {
+            'total_chunks': total,
+            'chunks_with_embeddings': with_embeddings,
+            'chunks_without_embeddings': total - with_embeddings,
+            'avg_chunk_length': round(avg_length, 2),
+            'sample_chunks': samples,
+            'approximate': approximate,
+        }
+        logger.info(f"Chunk statistics: {total} total, {with_embeddings} with embeddings")
+        return stats
 
     def search_chunks_by_text(
-        self, search_text: str, limit: int = 10
+        self, search_text: str, limit: int = 10, return_full_text: bool = False
     ) -> list[dict[str, Any]]:
-        """Case-insensitive text search over chunk content (for debugging — not the live search path)."""
+        """Case-insensitive text search over chunk content (for debugging — not the live search path).
+
+        Served by ``document_chunks_text_trgm_idx`` when ``CHUNK_TRIGRAM_INDEX``
+        is on and the search text has at least three characters. Only the
+        200-char preview is transferred unless ``return_full_text`` is set.
+        """
         if not self.is_connected:
             raise DatabaseUnavailableError("Cannot search chunks by text: Database is not connected")
 
         logger.debug("Searching chunks for text: %s", str(search_text)[:100].replace('\r', '').replace('\n', ' '))
-        with self.get_connection() as conn:
+        # The length is computed server-side only when the full text is not sent.
+        text_columns = "dc.chunk_text" if return_full_text else "LEFT(dc.chunk_text, 200), LENGTH(dc.chunk_text)"
+        with self.get_connection(read_only=True) as conn:
             with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT d.filename, dc.chunk_index, dc.chunk_text,
-                           LENGTH(dc.chunk_text) AS length
+                cursor.execute(f"""
+                    SELECT d.filename, dc.chunk_index, {text_columns}
                     FROM document_chunks dc
                     JOIN documents d ON dc.document_id = d.id
                     WHERE dc.chunk_text ILIKE %s ESCAPE '\\'
                     ORDER BY dc.chunk_index
                     LIMIT %s
                 """, (f'%{escape_sql_like(search_text)}%', limit))
-                results = [
-                    {
+                results = []
+                for r in cursor.fetchall():
+                    length = len(r[2]) if return_full_text else r[3]
+                    result = {
                         'filename': r[0],
                         'chunk_index': r[1],
-                        'preview': r[2][:200] + '...' if len(r[2]) > 200 else r[2],
-                        'full_text': r[2],
-                        'length': r[3],
+                        'preview': r[2][:200] + '...' if length > 200 else r[2],
+                        'length': length,
                     }
-                    for r in cursor.fetchall()
-                ]
+                    if return_full_text:
+                        result['full_text'] = r[2]
+                    results.append(result)
                 logger.info(f"Found {len(results)} chunks containing '{search_text}'")
                 return results
 
     def delete_all_documents(self) -> None:
-        """Delete every document and all its chunks. WARNING: irreversible."""
+        """Delete every document and all its chunks. WARNING: irreversible.
+
+        TRUNCATE instead of DELETE: no per-row WAL or FK cascade work. CASCADE
+        empties the tables keyed on chunks (chunk_stats, entity_relations,
+        annotations), whose rows the ON DELETE CASCADE foreign keys removed
+        before. Sequences are deliberately not restarted, so ids cited in old
+        conversations never resolve to a different, newer document.
+        """
         if not self.is_connected:
             raise DatabaseUnavailableError("Cannot delete documents: Database is not connected")
 
         logger.warning("Deleting ALL documents and chunks")
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
-                cursor.execute("DELETE FROM document_chunks")
-                chunks_deleted = cursor.rowcount
-                cursor.execute("DELETE FROM documents")
-                docs_deleted = cursor.rowcount
+                cursor.execute("TRUNCATE document_chunks, documents CASCADE")
                 conn.commit()
-        logger.info(f"Deleted {docs_deleted} documents and {chunks_deleted} chunks")
+        logger.info("Truncated documents and document_chunks")
 
     def get_stale_documents(self, max_age_hours: int, workspace_id: str | None = None) -> list[dict[str, Any]]:
         """Return documents whose last_ingested_at is older than max_age_hours.
@@ -49,7 +49,7 @@ class MemoriesMixin(MixinHost):
             raise DatabaseUnavailableError("Cannot insert memory: Database not connected")
 
         memory_id = str(uuid.uuid4())
-        emb_str = self._embedding_to_pg_array(np.array(embedding))
+        emb = np.asarray(embedding, dtype=np.float32)
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
@@ -58,7 +58,7 @@ class MemoriesMixin(MixinHost):
                                          memory_type, confidence, workspace_id)
                     VALUES (%s, %s, %s::vector, %s, %s, %s, %s)
                     """,
-                    (memory_id, _encrypt(content), emb_str, source_conv_id,
+                    (memory_id, _encrypt(content), emb, source_conv_id,
                      memory_type, confidence, workspace_id),
                 )
                 conn.commit()
@@ -136,29 +136,31 @@ class MemoriesMixin(MixinHost):
         """Return top-k memories ordered by cosine similarity, scoped to a workspace."""
         if not self.is_connected:
             return []
-        emb_str = self._embedding_to_pg_array(np.array(embedding))
+        emb = np.asarray(embedding, dtype=np.float32)
         # A memory with no workspace cannot be attributed to one, so it stays
         # invisible rather than surfacing everywhere — same call doc retrieval
         # makes. Unscoped callers (workspace_id=None) still see everything.
         allowed = self._allowed_workspace_ids(workspace_id, additional_workspace_ids)
         ws_clause = "  AND workspace_id = ANY(%s::uuid[])\n" if allowed else ""
-        params: list[Any] = [emb_str, emb_str, min_similarity]
+        # The query vector is bound once and referenced through the CTE.
+        params: list[Any] = [emb, min_similarity]
         if allowed:
             params.append(allowed)
-        params += [emb_str, top_k]
+        params.append(top_k)
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     f"""
+                    WITH q AS (SELECT %s::vector AS emb)
                     SELECT id::text, content, memory_type, confidence,
                            created_at, use_count,
-                           1 - (embedding <=> %s::vector) AS similarity
-                    FROM memories
+                           1 - (embedding <=> q.emb) AS similarity
+                    FROM memories CROSS JOIN q
                     WHERE embedding IS NOT NULL
                       AND deleted_at IS NULL
-                      AND 1 - (embedding <=> %s::vector) >= %s
+                      AND 1 - (embedding <=> q.emb) >= %s
                     {ws_clause}
-                    ORDER BY embedding <=> %s::vector
+                    ORDER BY embedding <=> q.emb
                     LIMIT %s
                     """,
                     tuple(params),
@@ -187,9 +189,9 @@ class MemoriesMixin(MixinHost):
         """
         if not self.is_connected:
             return False
-        emb_str = self._embedding_to_pg_array(np.array(embedding))
+        emb = np.asarray(embedding, dtype=np.float32)
         ws_clause = "  AND workspace_id = %s::uuid\n" if workspace_id else ""
-        params: list[Any] = [emb_str, threshold]
+        params: list[Any] = [emb, threshold]
         if workspace_id:
             params.append(workspace_id)
         with self.get_connection() as conn:
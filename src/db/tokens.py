@@ -25,7 +25,7 @@ class TokensMixin(MixinHost):
 
     def is_token_revoked(self, jti: str) -> bool:
         """Return True when the jti is in the deny-list."""
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             with conn.cursor() as cur:
                 cur.execute("SELECT 1 FROM revoked_tokens WHERE jti = %s", (jti,))
                 return cur.fetchone() is not None
@@ -115,7 +115,7 @@ class WorkspaceKeysMixin(MixinHost):
         if not presented or not presented.startswith(KEY_PREFIX) or not self.is_connected:
             return None
         prefix = presented[:_PREFIX_LEN]
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
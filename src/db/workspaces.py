@@ -283,7 +283,7 @@ class WorkspacesMixin(MixinHost):
         """Return the role string for this user in this workspace, or None if not a member."""
         if not self.is_connected:
             return None
-        with self.get_connection() as conn:
+        with self.get_connection(read_only=True) as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     "SELECT role FROM workspace_members WHERE workspace_id = %s AND user_id = %s",
@@ -12,13 +12,13 @@ logger = get_logger(__name__)
 
 
 class LocalChatException(Exception):
-    """Base class; logs a warning on construction and exposes to_dict() for API responses."""
+    """Base class; exposes to_dict() for API responses. Logging is left to the
+    catch site, so exceptions that are handled and discarded cost nothing."""
 
     def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
         self.message = message
         self.details = details or {}
         super().__init__(self.message)
-        logger.warning(f"{self.__class__.__name__}: {message}", extra={"exception_details": self.details})
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -100,9 +100,23 @@ EXCEPTION_STATUS_CODES: dict[type[Exception], int] = {
 }
 
 
-def get_status_code(exception: Exception) -> int:
-    return EXCEPTION_STATUS_CODES.get(type(exception), 500)
+# Per-class memo of the MRO walk in get_status_code; filled on first lookup.
+_STATUS_BY_CLASS: dict[type, int] = {}
 
 
-logger.info("Exception classes loaded")
+def get_status_code(exception: Exception) -> int:
+    """Status of the nearest mapped class on the MRO, so unregistered
+    subclasses inherit their parent's code."""
+    cls = type(exception)
+    code = _STATUS_BY_CLASS.get(cls)
+    if code is None:
+        code = next(
+            (EXCEPTION_STATUS_CODES[base] for base in cls.__mro__ if base in EXCEPTION_STATUS_CODES),
+            500,
+        )
+        _STATUS_BY_CLASS[cls] = code
+    return code
+
+
+logger.debug("Exception classes loaded")
 
@@ -1,10 +1,12 @@
 # Python 3.14 compatibility: Use string annotations to avoid __annotate__ issues
 from __future__ import annotations
 
+import re
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
+from typing_extensions import TypedDict  # pydantic rejects typing.TypedDict before 3.12
 
 _MODEL_NAME_EMPTY = 'Model name cannot be empty'
 _MODEL_NAME_INVALID_CHARS = 'Model name contains invalid characters'
@@ -13,6 +15,24 @@ from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Lowercased once: str.endswith takes the tuple in a single call, the set is for
+# exact file-type filters.
+_SUPPORTED_EXT_TUPLE = tuple(ext.lower() for ext in config.SUPPORTED_EXTENSIONS)
+_SUPPORTED_EXT_SET = frozenset(_SUPPORTED_EXT_TUPLE)
+
+# Path separators, '..' and shell metacharacters rejected in model names.
+_MODEL_NAME_FORBIDDEN_RE = re.compile(r'[/\\<>|&]|\.\.')
+# Unicode alphanumerics (as str.isalnum) plus '_', '-', '.', ':'.
+_MODEL_NAME_PULL_RE = re.compile(r'[\w.:-]+')
+
+
+class HistoryMessage(TypedDict):
+    """One prior chat turn. Validated by pydantic-core and kept as a plain dict;
+    keys other than role/content (e.g. the UI's timestamp) are dropped."""
+
+    role: Literal['user', 'assistant']
+    content: str
+
 
 class ChatRequest(BaseModel):
 
@@ -30,7 +50,7 @@ class ChatRequest(BaseModel):
         default=False,
         description="Whether to enrich RAG context with web search results"
     )
-    history: list[dict[str, str]] = Field(
+    history: list[HistoryMessage] = Field(
         default_factory=list,
         max_length=50,
         description="Chat conversation history"
@@ -82,16 +102,6 @@ class ChatRequest(BaseModel):
             raise ValueError('Message cannot be empty or whitespace only')
         return v.strip()
 
-    @field_validator('history')
-    @classmethod
-    def validate_history(cls, v: list[dict[str, str]]) -> list[dict[str, str]]:
-        for msg in v:
-            if 'role' not in msg or 'content' not in msg:
-                raise ValueError('History messages must have "role" and "content" fields')
-            if msg['role'] not in ['user', 'assistant']:
-                raise ValueError('Role must be "user" or "assistant"')
-        return v
-
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -126,7 +136,7 @@ class DocumentUploadRequest(BaseModel):
     @field_validator('filename')
     @classmethod
     def valid_extension(cls, v: str) -> str:
-        if not any(v.lower().endswith(ext) for ext in config.SUPPORTED_EXTENSIONS):
+        if not v.lower().endswith(_SUPPORTED_EXT_TUPLE):
             raise ValueError(
                 f'File type not supported. Allowed: {", ".join(config.SUPPORTED_EXTENSIONS)}'
             )
@@ -159,7 +169,7 @@ class ModelRequest(BaseModel):
         if not v.strip():
             raise ValueError(_MODEL_NAME_EMPTY)
         # Remove potentially dangerous characters
-        if any(char in v for char in ['/', '\\', '..', '<', '>', '|', '&']):
+        if _MODEL_NAME_FORBIDDEN_RE.search(v):
             raise ValueError(_MODEL_NAME_INVALID_CHARS)
         return v.strip()
 
@@ -211,7 +221,7 @@ class RetrievalRequest(BaseModel):
         if v is not None:
             if not v.startswith('.'):
                 raise ValueError('File type filter must start with a dot (e.g., ".pdf")')
-            if v not in config.SUPPORTED_EXTENSIONS:
+            if v.lower() not in _SUPPORTED_EXT_SET:
                 raise ValueError(
                     f'Unsupported file type. Allowed: {", ".join(config.SUPPORTED_EXTENSIONS)}'
                 )
@@ -231,6 +241,41 @@ class RetrievalRequest(BaseModel):
     }
 
 
+class TextSearchRequest(BaseModel):
+
+    search_text: str = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Substring to search chunk text for"
+    )
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Maximum number of chunks to return"
+    )
+    full_text: bool = Field(
+        default=False,
+        description="Return full chunk text instead of previews"
+    )
+
+    @field_validator('search_text')
+    @classmethod
+    def search_text_not_empty(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError('search_text cannot be empty')
+        return v.strip()
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {"search_text": "quarterly report", "limit": 10, "full_text": False}
+            ]
+        }
+    }
+
+
 class ModelPullRequest(BaseModel):
 
     model: str = Field(
@@ -246,7 +291,7 @@ class ModelPullRequest(BaseModel):
         if not v.strip():
             raise ValueError(_MODEL_NAME_EMPTY)
         # Basic validation for model name format
-        if not all(c.isalnum() or c in ['-', '_', '.', ':'] for c in v):
+        if not _MODEL_NAME_PULL_RE.fullmatch(v):
             raise ValueError(_MODEL_NAME_INVALID_CHARS)
         return v.strip()
 
@@ -329,7 +374,7 @@ class ErrorResponse(BaseModel):
     }
 
 
-logger.info("Validation models loaded")
+logger.debug("Validation models loaded")
 
 
 class LoginRequest(BaseModel):
@@ -23,13 +23,14 @@ Endpoints (registered in ``src/routes_fastapi/settings_routes.py``)::
 """
 
 import threading
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
 from datetime import datetime
-from functools import wraps
-from time import time
+from functools import lru_cache, wraps
+from time import perf_counter
 from typing import Any
 
+import numpy as np
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
@@ -38,6 +39,44 @@ from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Most recent values kept per histogram series (percentiles are over this window).
+_HISTOGRAM_WINDOW = 1000
+# Upper bounds of the exported Prometheus buckets (+Inf is the total count).
+_HISTOGRAM_BUCKETS = (0.1, 0.5, 1.0)
+
+
+@lru_cache(maxsize=4096)
+def _labelled_key(name: str, items: tuple) -> str:
+    """Build 'name{k="v",...}' once per distinct label set; the same few
+    method/endpoint/status combinations recur on every request."""
+    label_str = ','.join(f'{k}="{v}"' for k, v in sorted(items))
+    return f'{name}{{{label_str}}}'
+
+
+class _HistogramTotals:
+    """Lifetime count/sum/min/max and cumulative bucket counts of one series,
+    updated per record() so reading them costs nothing per scrape."""
+
+    __slots__ = ('count', 'sum', 'min', 'max', 'buckets')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.buckets = [0] * len(_HISTOGRAM_BUCKETS)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        for i, bound in enumerate(_HISTOGRAM_BUCKETS):
+            if value <= bound:
+                self.buckets[i] += 1
+
 
 class MetricsCollector:
     """
@@ -48,9 +87,13 @@ class MetricsCollector:
 
     def __init__(self):
         """Initialize metrics collector."""
+        # Guards the dicts only; keys are built and histogram statistics are
+        # computed outside it, so concurrent updates wait for a dict operation.
         self._lock = threading.Lock()
         self._counters: dict[str, int] = defaultdict(int)
-        self._histograms: dict[str, list] = defaultdict(list)
+        # Bounded to the last _HISTOGRAM_WINDOW values; deque drops the oldest on append.
+        self._histograms: dict[str, deque] = defaultdict(lambda: deque(maxlen=_HISTOGRAM_WINDOW))
+        self._histogram_totals: dict[str, _HistogramTotals] = defaultdict(_HistogramTotals)
         self._gauges: dict[str, float] = {}
         self._start_time = datetime.now()
 
@@ -65,8 +108,8 @@ class MetricsCollector:
             value: Increment value
             labels: Optional labels dict
         """
+        key = self._make_key(name, labels)
         with self._lock:
-            key = self._make_key(name, labels)
             self._counters[key] += value
 
     def record(self, name: str, value: float, labels: dict | None = None) -> None:
@@ -78,13 +121,10 @@ class MetricsCollector:
             value: Value to record
             labels: Optional labels dict
         """
+        key = self._make_key(name, labels)
         with self._lock:
-            key = self._make_key(name, labels)
             self._histograms[key].append(value)
-
-            # Keep last 1000 values
-            if len(self._histograms[key]) > 1000:
-                self._histograms[key] = self._histograms[key][-1000:]
+            self._histogram_totals[key].add(value)
 
     def set_gauge(self, name: str, value: float, labels: dict | None = None) -> None:
         """
@@ -95,8 +135,8 @@ class MetricsCollector:
             value: Gauge value
             labels: Optional labels dict
         """
+        key = self._make_key(name, labels)
         with self._lock:
-            key = self._make_key(name, labels)
             self._gauges[key] = value
 
     def get_metrics(self) -> dict[str, Any]:
@@ -113,47 +153,57 @@ class MetricsCollector:
                 'gauges': dict(self._gauges),
                 'uptime_seconds': (datetime.now() - self._start_time).total_seconds()
             }
+            histograms = {
+                k: (t.count, t.sum, t.min, t.max, list(t.buckets), list(self._histograms[k]))
+                for k, t in self._histogram_totals.items()
+            }
 
-            # Calculate histogram statistics
-            for key, values in self._histograms.items():
-                if values:
-                    metrics['histograms'][key] = {
-                        'count': len(values),
-                        'sum': sum(values),
-                        'min': min(values),
-                        'max': max(values),
-                        'avg': sum(values) / len(values),
-                        'p50': self._percentile(values, 50),
-                        'p95': self._percentile(values, 95),
-                        'p99': self._percentile(values, 99),
-                    }
-
-            return metrics
+        # count/sum/min/max/buckets are lifetime totals (monotonic, as Prometheus
+        # expects); percentiles come from the recent window.
+        for key, (count, total, low, high, buckets, window) in histograms.items():
+            p50, p95, p99 = self._percentiles(window, (50, 95, 99))
+            metrics['histograms'][key] = {
+                'count': count,
+                'sum': total,
+                'min': low,
+                'max': high,
+                'avg': total / count,
+                'p50': p50,
+                'p95': p95,
+                'p99': p99,
+                'buckets': dict(zip(_HISTOGRAM_BUCKETS, buckets, strict=True)),
+            }
+
+        return metrics
 
     def _make_key(self, name: str, labels: dict | None) -> str:
         """Create metric key with labels."""
         if not labels:
             return name
+        items = tuple(labels.items())
+        try:
+            return _labelled_key(name, items)
+        except TypeError:  # unhashable label value; format without caching
+            return _labelled_key.__wrapped__(name, items)
 
-        label_str = ','.join(f'{k}="{v}"' for k, v in sorted(labels.items()))
-        return f'{name}{{{label_str}}}'
-
-    def _percentile(self, values: list, percentile: int) -> float:
-        """Calculate percentile."""
-        sorted_values = sorted(values)
-        index = int(len(sorted_values) * (percentile / 100.0))
-        return sorted_values[min(index, len(sorted_values) - 1)]
+    def _percentiles(self, values: list, percentiles: tuple[int, ...]) -> list[float]:
+        """Nearest-rank percentiles of values via one O(n) np.partition, not a sort."""
+        n = len(values)
+        ranks = [min(int(n * (p / 100.0)), n - 1) for p in percentiles]
+        partitioned = np.partition(np.asarray(values, dtype=np.float64), ranks)
+        return [float(partitioned[r]) for r in ranks]
 
     def reset(self) -> None:
         """Reset all metrics."""
         with self._lock:
             self._counters.clear()
             self._histograms.clear()
+            self._histogram_totals.clear()
             self._gauges.clear()
             self._start_time = datetime.now()
 
     def get_histogram_values(self) -> dict[str, list]:
-        """Return a snapshot of raw histogram value lists (for Prometheus bucket export)."""
+        """Return a snapshot of the recent raw values of each histogram."""
         with self._lock:
             return {k: list(v) for k, v in self._histograms.items() if v}
 
@@ -185,12 +235,12 @@ def timed(metric_name: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start = time()
+            start = perf_counter()
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                duration = time() - start
+                duration = perf_counter() - start
                 get_metrics().record(metric_name, duration)
 
                 if duration > 1.0:  # Log slow operations
@@ -227,9 +277,9 @@ class MetricsMiddleware(BaseHTTPMiddleware):
     """ASGI middleware that records HTTP request duration and count for every request."""
 
     async def dispatch(self, request: Request, call_next) -> Response:
-        start = time()
+        start = perf_counter()
         response = await call_next(request)
-        duration = time() - start
+        duration = perf_counter() - start
 
         metrics = get_metrics()
         metrics.record("http_request_duration_seconds", duration, labels={
@@ -310,7 +360,6 @@ def export_prometheus_metrics() -> str:
     """
     collector = get_metrics()
     metrics = collector.get_metrics()
-    raw_histograms = collector.get_histogram_values()
     lines = []
 
     # Counters — one TYPE declaration per base name, all label variants beneath it
@@ -329,12 +378,10 @@ def export_prometheus_metrics() -> str:
     for base_name, histogram_entries in histogram_groups.items():
         lines.append(f'# TYPE {base_name} histogram')
         for key, stats in histogram_entries.items():
-            raw = raw_histograms.get(key, [])
             lines.append(f'{key}_count {stats["count"]}')
             lines.append(f'{key}_sum {stats["sum"]}')
-            lines.append(f'{key}_bucket{{le="0.1"}} {sum(1 for v in raw if v <= 0.1)}')
-            lines.append(f'{key}_bucket{{le="0.5"}} {sum(1 for v in raw if v <= 0.5)}')
-            lines.append(f'{key}_bucket{{le="1.0"}} {sum(1 for v in raw if v <= 1.0)}')
+            for bound, bucket_count in stats['buckets'].items():
+                lines.append(f'{key}_bucket{{le="{bound}"}} {bucket_count}')
             lines.append(f'{key}_bucket{{le="+Inf"}} {stats["count"]}')
 
     # Gauges
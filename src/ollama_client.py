@@ -880,4 +880,4 @@ class OllamaClient:
 
 ollama_client = OllamaClient()
 
-logger.info("Ollama client module loaded")
+logger.debug("Ollama client module loaded")
@@ -7,9 +7,12 @@ lexical retrieval arms, merged), re-ranking, diversity filtering, and
 context formatting for LLM prompts.
 """
 
+import contextvars
 import re
 import time
 from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, NamedTuple
 
 from .. import config
@@ -24,6 +27,33 @@ from .cache import embedding_cache
 logger = get_logger(__name__)
 
 
+# Each executor thread holds a pooled DB connection while it searches, so each
+# executor gets a quarter of DB_POOL_MAX_CONN and a burst of searches cannot
+# drain the pool request threads draw from. Raise DB_POOL_MAX_CONN for more
+# search concurrency.
+_EXECUTOR_WORKERS = max(1, config.DB_POOL_MAX_CONN // 4)
+
+# Runs the lexical arm while the calling thread runs the semantic one; each
+# search checks out its own pooled connection, so the two overlap server time.
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=_EXECUTOR_WORKERS, thread_name_prefix="rag-lexical")
+
+# Runs the per-workspace pipelines of a cross-workspace query. Kept separate from
+# _SEARCH_EXECUTOR because each pipeline submits its own lexical arm there.
+_WORKSPACE_EXECUTOR = ThreadPoolExecutor(max_workers=_EXECUTOR_WORKERS, thread_name_prefix="rag-workspace")
+
+
+def _submit(executor: ThreadPoolExecutor, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Submit ``fn`` in a copy of the caller's context, so contextvars such as
+    the request ID still reach log lines written on the worker thread."""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def shutdown_executors() -> None:
+    """Stop the search executors, dropping queued searches. Called on app shutdown."""
+    for executor in (_WORKSPACE_EXECUTOR, _SEARCH_EXECUTOR):
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 class RetrievalResult(NamedTuple):
     chunk_text: str
     filename: str
@@ -262,6 +292,13 @@ class RetrievalMixin:
             Filtered results dict mapping chunk_id to result data, or empty dict
             when nothing passes the similarity threshold.
         """
+        lexical_future = None
+        if use_hybrid_search:
+            lexical_future = _submit(
+                _SEARCH_EXECUTOR, self._run_lexical_search,
+                query_clean, top_k * 2, file_type_filter, filename_filter, workspace_id, source_ids,
+            )
+
         semantic_results = self._db.search_similar_chunks(
             query_embedding,
             top_k=top_k * 2,
@@ -274,10 +311,9 @@ class RetrievalMixin:
         logger.debug(f"[RAG] Semantic search returned {len(semantic_results)} results")
 
         lexical_results: list = []
-        if use_hybrid_search:
-            lexical_results = self._run_lexical_search(
-                query_clean, top_k * 2, file_type_filter, filename_filter, workspace_id, source_ids
-            )
+        if lexical_future is not None:
+            # _run_lexical_search never raises — it degrades to [].
+            lexical_results = lexical_future.result()
             logger.debug(f"[RAG] Lexical search returned {len(lexical_results)} results")
 
         if not semantic_results and not lexical_results:
@@ -439,6 +475,19 @@ class RetrievalMixin:
 
         logger.debug(f"[RAG] Embedding generated in {time.time() - start_time:.3f}s")
 
+        # Cross-workspace: the additional workspaces share the query embedding, so
+        # their searches start now and overlap the primary one instead of queuing
+        # behind it. Results are merged in request order, then re-ranked.
+        extra_futures = [
+            _submit(
+                _WORKSPACE_EXECUTOR, self._run_retrieval_pipeline,
+                query_clean, query_embedding, top_k, min_similarity, file_type_filter,
+                use_hybrid_search, filename_filter=filename_filter, workspace_id=extra_ws_id,
+                source_ids=source_ids,
+            )
+            for extra_ws_id in (additional_workspace_ids or [])
+        ]
+
         filtered_results = self._run_retrieval_pipeline(
             query_clean, query_embedding, top_k, min_similarity, file_type_filter, use_hybrid_search,
             filename_filter=filename_filter,
@@ -446,14 +495,8 @@ class RetrievalMixin:
             source_ids=source_ids,
         )
 
-        # Cross-workspace: merge results from additional workspaces and re-rank
-        for extra_ws_id in (additional_workspace_ids or []):
-            extra_results = self._run_retrieval_pipeline(
-                query_clean, query_embedding, top_k, min_similarity, file_type_filter,
-                use_hybrid_search, filename_filter=filename_filter, workspace_id=extra_ws_id,
-                source_ids=source_ids,
-            )
-            filtered_results.update(extra_results)
+        for future in extra_futures:
+            filtered_results.update(future.result())
 
         if not filtered_results:
             return []
@@ -192,6 +192,7 @@ async def _generate_sse(
         yield f"data: {json.dumps(done_payload)}\n\n"
 
     except exceptions.LocalChatException as exc:
+        logger.warning("[CHAT API] %s: %s", type(exc).__name__, exc.message)
         yield f"data: {json.dumps({'error': 'GenerationError', 'message': exc.message, 'done': True})}\n\n"
     except Exception:
         logger.exception("[CHAT API] Unexpected error generating response")
@@ -327,6 +328,7 @@ async def api_chat(request: Request) -> Any:
     except PydanticValidationError as exc:
         return JSONResponse({"error": "ValidationError", "success": False, "message": "Invalid request", "details": exc.errors()}, status_code=422)
     except exceptions.LocalChatException as exc:
+        logger.warning("[CHAT API] %s: %s", type(exc).__name__, exc.message)
         return JSONResponse({"success": False, "message": exc.message}, status_code=500)
     except Exception:
         logger.exception("[CHAT API] Unexpected error")
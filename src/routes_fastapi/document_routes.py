@@ -12,10 +12,12 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 from starlette.datastructures import UploadFile as _StarletteUploadFile
 
 from .. import config
 from ..db.connection import DatabaseUnavailableError
+from ..models import TextSearchRequest
 from ..security_fastapi import get_current_user_id, require_admin_dep
 from ..utils.file_validation import validate_file_content
 from ..utils.logging_config import get_logger
@@ -187,9 +189,9 @@ def api_document_stats(request: Request) -> Any:
         db = request.app.state.db
         return {
             "success": True,
-            "document_count": db.get_document_count(workspace_id=workspace_id),
-            "chunk_count": db.get_chunk_count(workspace_id=workspace_id),
-            "chunk_statistics": db.get_chunk_statistics(),
+            **db.get_database_stats(workspace_id=workspace_id),
+            # Corpus-wide diagnostics: sampled, so the panel does not scan every chunk.
+            "chunk_statistics": db.get_chunk_statistics(exact=False),
             "max_upload_size": config.MAX_CONTENT_LENGTH,
         }
     except DatabaseUnavailableError:
@@ -246,13 +248,18 @@ async def api_search_text(request: Request) -> Any:
     if denied:
         return denied
     data = await request.json() if await request.body() else {}
-    search_text = data.get("search_text", "").strip()
-    limit = data.get("limit", 10)
-    if not search_text:
-        return JSONResponse({"success": False, "message": "search_text required"}, status_code=400)
     try:
-        results = request.app.state.db.search_chunks_by_text(search_text, limit)
-        return {"success": True, "search_text": search_text, "count": len(results), "results": results}
+        body = TextSearchRequest(**data)
+    except (ValidationError, TypeError) as exc:
+        errors = exc.errors() if isinstance(exc, ValidationError) else []
+        field = errors[0]["loc"][0] if errors and errors[0]["loc"] else "request body"
+        message = "search_text required" if field == "search_text" else f"Invalid {field}"
+        return JSONResponse({"success": False, "message": message}, status_code=400)
+    try:
+        results = request.app.state.db.search_chunks_by_text(
+            body.search_text, body.limit, return_full_text=body.full_text,
+        )
+        return {"success": True, "search_text": body.search_text, "count": len(results), "results": results}
     except Exception:
         logger.exception("Error searching text")
         return JSONResponse({"success": False, "message": "Search failed"}, status_code=500)
@@ -266,17 +273,16 @@ def api_get_chunk_context(chunk_id: int, request: Request, window: int = 1) -> A
     window = min(window, 5)
     try:
         db = request.app.state.db
-        chunk = db.get_chunk_by_id(chunk_id)
-        if chunk is None:
+        context = db.get_chunk_context(chunk_id, window_size=window)
+        if context is None:
             return JSONResponse({"success": False, "message": "Chunk not found"}, status_code=404)
-        adjacent = db.get_adjacent_chunks(chunk["document_id"], chunk["chunk_index"], window_size=window)
         return {
             "success": True,
             "chunk_id": chunk_id,
-            "document_id": chunk["document_id"],
-            "chunk_index": chunk["chunk_index"],
+            "document_id": context["document_id"],
+            "chunk_index": context["chunk_index"],
             "window": window,
-            "chunks": [{"chunk_text": text, "chunk_index": idx} for text, idx in adjacent],
+            "chunks": [{"chunk_text": text, "chunk_index": idx} for text, idx in context["chunks"]],
         }
     except Exception:
         logger.exception("Error fetching chunk context")
@@ -28,11 +28,7 @@ def _collect_document_stats(app_state: Any) -> dict:
     if not db:
         return {"document_count": 0, "chunk_count": 0, "db_available": False}
     try:
-        return {
-            "document_count": db.get_document_count(),
-            "chunk_count": db.get_chunk_count(),
-            "db_available": True,
-        }
+        return {**db.get_database_stats(), "db_available": True}
     except Exception as exc:
         logger.warning("Settings: could not fetch document stats: %s", exc)
         return {"document_count": 0, "chunk_count": 0, "db_available": False}
@@ -114,4 +114,4 @@ def remove_null_bytes(text: str) -> str:
     return text.replace('\x00', '')
 
 
-logger.info("Sanitization utilities loaded")
+logger.debug("Sanitization utilities loaded")
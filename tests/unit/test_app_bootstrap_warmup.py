@@ -614,6 +614,14 @@ class TestInitCaching:
 class TestSetupCleanupHandlers:
     """Test _setup_cleanup_handlers (src/app_bootstrap.py)."""
 
+    @pytest.fixture(autouse=True)
+    def _keep_search_executors(self):
+        """cleanup() shuts down the module-level search executors; keep them
+        alive for the retrieval tests that run later in this process."""
+        with patch("src.rag.retrieval.shutdown_executors") as mock_shutdown:
+            self.shutdown_executors = mock_shutdown
+            yield
+
     def test_cleanup_stops_sync_worker_and_closes_connected_db(self):
         from src.app_bootstrap import _setup_cleanup_handlers
 
@@ -631,8 +639,26 @@ class TestSetupCleanupHandlers:
         cleanup_fn()
 
         sync_worker.stop.assert_called_once()
+        self.shutdown_executors.assert_called_once()
         db.close.assert_called_once()
 
+    def test_cleanup_runs_once_when_signal_and_atexit_both_fire(self):
+        from src.app_bootstrap import _setup_cleanup_handlers
+
+        app = MagicMock()
+        sync_worker = MagicMock()
+        app.state.sync_worker = sync_worker
+        app.state.db = None
+
+        with patch("atexit.register") as mock_atexit, patch("signal.signal"):
+            _setup_cleanup_handlers(app)
+
+        cleanup_fn = mock_atexit.call_args[0][0]
+        cleanup_fn()
+        cleanup_fn()
+
+        sync_worker.stop.assert_called_once()
+
     def test_cleanup_skips_db_close_when_not_connected(self):
         from src.app_bootstrap import _setup_cleanup_handlers
 
@@ -67,6 +67,54 @@ class TestVectorLoaderEdgeCases:
         assert result == []
 
 
+class TestBinaryCopy:
+    """Test the binary vector dumper and COPY helper."""
+
+    def test_vector_binary_dumper_writes_pgvector_frame(self):
+        """Frame is int16 dim, int16 unused, then big-endian float32 values."""
+        import struct
+
+        from src.db.connection import VectorBinaryDumper
+
+        dumped = VectorBinaryDumper(list).dump([1.0, 2.5, -0.5])
+
+        assert len(dumped) == 4 + 3 * 4
+        assert struct.unpack('>HHfff', dumped) == (3, 0, 1.0, 2.5, -0.5)
+
+    def test_copy_rows_binary_streams_every_row(self):
+        """One COPY statement; column types set once; one write_row per row."""
+        from src.db.connection import copy_rows_binary
+
+        cursor = MagicMock()
+        copy = cursor.copy.return_value.__enter__.return_value
+        rows = [(1, [0.1, 0.2]), (2, [0.3, 0.4])]
+
+        copy_rows_binary(cursor, 'document_chunks', ['id', 'embedding'], ['int4', 'vector'], rows)
+
+        cursor.copy.assert_called_once()
+        copy.set_types.assert_called_once_with(['int4', 'vector'])
+        assert [c.args[0] for c in copy.write_row.call_args_list] == rows
+
+    def test_register_vector_types_binds_ndarray_only(self):
+        """ndarrays go out as binary vectors; lists keep psycopg's array dumper."""
+        import numpy as np
+        import psycopg
+        from psycopg.adapt import AdaptersMap, PyFormat
+
+        from src.db.connection import VectorBinaryDumper, register_vector_types
+
+        conn = MagicMock()
+        conn.adapters = AdaptersMap(psycopg.adapters)
+        conn.cursor.return_value.__enter__.return_value.fetchone.return_value = (16400, 16405)
+
+        register_vector_types(conn)
+
+        ndarray_dumper = conn.adapters.get_dumper(np.ndarray, PyFormat.AUTO)
+        assert issubclass(ndarray_dumper, VectorBinaryDumper)
+        assert ndarray_dumper.oid == 16400
+        assert not issubclass(conn.adapters.get_dumper(list, PyFormat.AUTO), VectorBinaryDumper)
+
+
 class TestServerAvailabilityChecks:
     """Test check_server_availability edge cases."""
 
@@ -171,6 +219,150 @@ class TestInitializeErrorPaths:
 
                         # Verify pool was created with configure callback
                         assert mock_pool.called
+                        mock_pool.return_value.wait.assert_called_once()
+
+    def test_initialize_passes_prepare_threshold_to_pool(self):
+        """Pooled connections use the configured server-side prepare threshold."""
+        from src import config
+        from src import db as db_module
+
+        test_db = db_module.Database()
+
+        with patch.object(test_db, 'check_server_availability', return_value=(True, "OK")):
+            with patch.object(test_db, '_ensure_vector_extension'):
+                with patch('src.db.connection.ConnectionPool') as mock_pool:
+                    with patch.object(config, 'DB_PREPARE_THRESHOLD', 0):
+                        with patch.object(test_db, '_ensure_extensions_and_tables'):
+                            test_db.initialize()
+
+        assert mock_pool.call_args.kwargs['kwargs']['prepare_threshold'] == 0
+
+    def _configure_statements(self, **overrides):
+        """Run the pool's configure callback against a mock connection."""
+        from src import config
+        from src import db as db_module
+
+        test_db = db_module.Database()
+        with patch.object(test_db, 'check_server_availability', return_value=(True, "OK")), \
+                patch.object(test_db, '_ensure_vector_extension'), \
+                patch.object(test_db, '_ensure_extensions_and_tables'), \
+                patch('src.db.connection.ConnectionPool') as mock_pool:
+            test_db.initialize()
+        configure = mock_pool.call_args.kwargs['configure']
+
+        conn = MagicMock()
+        conn.info.transaction_status = 0
+        cursor = conn.cursor.return_value.__enter__.return_value
+        with patch('src.db.connection.register_vector_types'), \
+                patch('src.db.connection.set_json_loads') as self.set_json_loads, \
+                patch.multiple(config, **overrides):
+            configure(conn)
+        return [c.args[0] for c in cursor.execute.call_args_list]
+
+    def test_configure_connection_leaves_iterative_scan_off_by_default(self):
+        statements = self._configure_statements(HNSW_ITERATIVE_SCAN='', HNSW_EF_SEARCH=100, DB_JIT=True)
+        assert statements == ['SET hnsw.ef_search = 100']
+
+    def test_configure_connection_disables_jit_by_default(self):
+        statements = self._configure_statements(HNSW_ITERATIVE_SCAN='', DB_JIT=False)
+        assert 'SET jit = off' in statements
+
+    def test_configure_connection_uses_orjson_for_jsonb_when_installed(self):
+        orjson = pytest.importorskip('orjson')
+        self._configure_statements(HNSW_ITERATIVE_SCAN='')
+        self.set_json_loads.assert_called_once()
+        assert self.set_json_loads.call_args.args[0] is orjson.loads
+
+    def test_configure_connection_enables_iterative_scan_when_configured(self):
+        statements = self._configure_statements(
+            HNSW_ITERATIVE_SCAN='strict_order', HNSW_MAX_SCAN_TUPLES=5000
+        )
+        assert 'SET hnsw.iterative_scan = strict_order' in statements
+        assert 'SET hnsw.max_scan_tuples = 5000' in statements
+
+    def test_initialize_tolerates_pool_warmup_timeout(self):
+        """A slow warm-up logs a warning but still reports the database as connected."""
+        from psycopg_pool import PoolTimeout
+
+        from src import db as db_module
+
+        test_db = db_module.Database()
+
+        with patch.object(test_db, 'check_server_availability', return_value=(True, "OK")):
+            with patch.object(test_db, '_ensure_vector_extension'):
+                with patch('src.db.connection.ConnectionPool') as mock_pool:
+                    mock_pool.return_value.wait.side_effect = PoolTimeout("slow")
+                    with patch.object(test_db, '_ensure_extensions_and_tables'):
+                        success, _ = test_db.initialize()
+
+        assert success is True
+        assert test_db.is_connected is True
+
+
+class TestEnsureTablesHnswBuild:
+    """Test HNSW build tuning in _ensure_extensions_and_tables()."""
+
+    def _run(self, index_missing):
+        from src import db as db_module
+
+        test_db = db_module.Database()
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (index_missing, 'x', 'x')
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+
+        with patch.object(test_db, 'get_connection') as mock_gc:
+            mock_gc.return_value.__enter__.return_value = conn
+            test_db._ensure_extensions_and_tables()
+        return [c.args for c in cursor.execute.call_args_list]
+
+    def test_build_settings_are_transaction_local(self):
+        from src import config
+
+        calls = self._run(index_missing=False)
+        tuning = next(args for args in calls if 'maintenance_work_mem' in args[0])
+        assert "set_config('maintenance_work_mem', %s, true)" in tuning[0]
+        assert tuning[1] == (
+            config.HNSW_BUILD_MAINTENANCE_WORK_MEM, str(config.HNSW_BUILD_PARALLEL_WORKERS)
+        )
+
+    def test_analyze_runs_only_when_hnsw_index_is_new(self):
+        assert ('ANALYZE document_chunks',) in self._run(index_missing=True)
+        assert ('ANALYZE document_chunks',) not in self._run(index_missing=False)
+
+    def test_trigram_index_only_when_enabled(self):
+        from src import config
+
+        def trigram_calls():
+            return [args for args in self._run(index_missing=False) if 'gin_trgm_ops' in args[0]]
+
+        assert trigram_calls() == []
+        with patch.object(config, 'CHUNK_TRIGRAM_INDEX', True):
+            assert len(trigram_calls()) == 1
+
+    def test_missing_tsm_system_rows_is_tolerated(self):
+        import psycopg
+
+        from src import db as db_module
+
+        test_db = db_module.Database()
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (False, 'x', 'x')
+
+        def execute(query, *args):
+            if 'tsm_system_rows' in query:
+                raise psycopg.errors.UndefinedFile("extension not available")
+
+        cursor.execute.side_effect = execute
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+
+        with patch.object(test_db, 'get_connection') as mock_gc:
+            mock_gc.return_value.__enter__.return_value = conn
+            test_db._ensure_extensions_and_tables()
+
+        assert test_db.has_tsm_system_rows is False
+        assert ('ANALYZE document_chunks',) not in [c.args for c in cursor.execute.call_args_list]
 
 
 class TestCreateDatabase:
@@ -254,6 +446,68 @@ class TestChunkStatistics:
             assert stats['total_chunks'] == 0
             assert stats['avg_chunk_length'] == 0
 
+    def test_sample_uses_system_rows_when_available(self):
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (0, 0, None)
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn, \
+                patch.object(db_module.db, 'has_tsm_system_rows', True):
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            db_module.db.get_chunk_statistics()
+
+        sample_sql = mock_cursor.execute.call_args_list[-1].args[0]
+        assert 'TABLESAMPLE SYSTEM_ROWS(30)' in sample_sql
+        assert 'LEFT(dc.chunk_text, 200)' in sample_sql
+
+    def _sampled_stats(self, counts_row):
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = counts_row
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn, \
+                patch.object(db_module.db, 'has_tsm_system_rows', True):
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            stats = db_module.db.get_chunk_statistics(exact=False)
+        return stats, mock_cursor.execute.call_args_list[0].args[0]
+
+    def test_inexact_statistics_scale_sample_to_row_estimate(self):
+        stats, counts_sql = self._sampled_stats((1000, 900, 480.0, 50_000))
+        assert 'SYSTEM_ROWS(1000)' in counts_sql
+        assert stats['approximate'] is True
+        assert stats['total_chunks'] == 50_000
+        assert stats['chunks_with_embeddings'] == 45_000
+        assert stats['avg_chunk_length'] == 480.0
+
+    def test_inexact_statistics_exact_when_sample_covers_table(self):
+        stats, _ = self._sampled_stats((12, 12, 300.0, -1))
+        assert stats['approximate'] is False
+        assert stats['total_chunks'] == 12
+
+    def test_counts_and_sample_share_one_pipeline(self):
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (0, 0, None)
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            db_module.db.get_chunk_statistics()
+
+        mock_conn.pipeline.assert_called_once()
+        assert mock_cursor.execute.call_count == 2
+
 
 class TestSearchChunksByText:
     """Test search_chunks_by_text method."""
@@ -280,7 +534,26 @@ class TestSearchChunksByText:
             assert len(results) == 2
             assert results[0]['filename'] == "doc.pdf"
             assert 'preview' in results[0]
-            assert 'full_text' in results[0]
+            assert 'full_text' not in results[0]
+            assert 'LEFT(dc.chunk_text, 200)' in mock_cursor.execute.call_args[0][0]
+
+    def test_search_chunks_by_text_full_text_on_request(self):
+        from src import db as db_module
+
+        long_text = "keyword " * 50
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [("doc.pdf", 0, long_text)]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            results = db_module.db.search_chunks_by_text("keyword", return_full_text=True)
+
+        assert results[0]['full_text'] == long_text
+        assert results[0]['preview'] == long_text[:200] + '...'
+        assert results[0]['length'] == len(long_text)
+        assert 'LENGTH(' not in mock_cursor.execute.call_args[0][0]
 
     def test_search_chunks_by_text_no_matches(self):
         """Test text search with no matches."""
@@ -345,6 +618,7 @@ class TestDeleteAllDocuments:
 
             # Verify commit was called
             assert mock_conn.commit.called
+            mock_cursor.execute.assert_called_once_with("TRUNCATE document_chunks, documents CASCADE")
 
 
 class TestGetAdjacentChunks:
@@ -376,6 +650,44 @@ class TestGetAdjacentChunks:
 
             assert len(results) == 3
             assert results[1][1] == 1  # Middle chunk index
+            assert mock_cursor.execute.call_args.kwargs['prepare'] is True
+
+    def test_get_chunk_context_fetches_chunk_and_window_in_one_query(self):
+        """Anchor chunk and its neighbours come back from a single execute."""
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [
+            (7, 1, "Chunk 0 text", 0),
+            (7, 1, "Chunk 1 text", 1),
+            (7, 1, "Chunk 2 text", 2),
+        ]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            context = db_module.db.get_chunk_context(42, window_size=1)
+
+        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_args[0][1] == (1, 1, 42)
+        assert context == {
+            'document_id': 7,
+            'chunk_index': 1,
+            'chunks': [("Chunk 0 text", 0), ("Chunk 1 text", 1), ("Chunk 2 text", 2)],
+        }
+
+    def test_get_chunk_context_missing_chunk_returns_none(self):
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            assert db_module.db.get_chunk_context(999) is None
 
 
 class TestConnectionPoolManagement:
@@ -392,6 +704,55 @@ class TestConnectionPoolManagement:
             with test_db.get_connection():
                 pass
 
+    def test_get_connection_read_only_uses_autocommit_and_restores_it(self):
+        """Read-only blocks skip BEGIN/COMMIT; the pooled connection goes back
+        with autocommit off for the next (transactional) borrower."""
+        from src import db as db_module
+
+        test_db = db_module.Database()
+        conn = MagicMock()
+        conn.autocommit = False
+        conn.closed = False
+        conn.info.transaction_status = 0
+        test_db.connection_pool = MagicMock()
+        test_db.connection_pool.getconn.return_value = conn
+
+        with test_db.get_connection(read_only=True) as borrowed:
+            assert borrowed.autocommit is True
+
+        assert conn.autocommit is False
+        conn.commit.assert_not_called()
+        test_db.connection_pool.putconn.assert_called_once_with(conn)
+
+    def test_get_connection_returns_connection_when_autocommit_switch_fails(self):
+        """A connection that rejects autocommit (e.g. left mid-transaction)
+        must still be returned to the pool."""
+        import psycopg
+
+        from src import db as db_module
+
+        class _StuckConnection(MagicMock):
+            @property
+            def autocommit(self):
+                return False
+
+            @autocommit.setter
+            def autocommit(self, value):
+                raise psycopg.ProgrammingError("can't change autocommit now")
+
+        test_db = db_module.Database()
+        conn = _StuckConnection()
+        conn.closed = False
+        test_db.connection_pool = MagicMock()
+        test_db.connection_pool.getconn.return_value = conn
+
+        with pytest.raises(psycopg.ProgrammingError):
+            with test_db.get_connection(read_only=True):
+                pass
+
+        conn.rollback.assert_called_once()
+        test_db.connection_pool.putconn.assert_called_once_with(conn)
+
     def test_close_handles_exception(self):
         """Test close() handles exceptions gracefully."""
         from src import db as db_module
@@ -69,7 +69,6 @@ def _memories_mixin(connected=True, **conn_kwargs):
     m = MemoriesMixin()
     m.is_connected = connected
     m.get_connection = MagicMock(return_value=conn)
-    m._embedding_to_pg_array = MagicMock(return_value="[0.1,0.2]")
     return m, conn, cur
 
 
@@ -205,10 +204,13 @@ class TestInsertMemory:
         # Must be a valid UUID
         uuid.UUID(result)
 
-    def test_calls_embedding_conversion(self):
-        m, _, _ = _memories_mixin()
+    def test_binds_embedding_as_float32_array(self):
+        import numpy as np
+
+        m, _, cur = _memories_mixin()
         m.insert_memory("fact", [0.5] * 8)
-        m._embedding_to_pg_array.assert_called_once()
+        bound = cur.execute.call_args[0][1][2]
+        assert isinstance(bound, np.ndarray) and bound.dtype == np.float32
 
 
 class TestUpdateMemoryUsage:
@@ -271,6 +273,14 @@ class TestSearchMemories:
         m, _, _ = _memories_mixin(connected=False)
         assert m.search_memories([0.1] * 10) == []
 
+    def test_query_vector_is_bound_once(self):
+        import numpy as np
+
+        m, _, cur = _memories_mixin()
+        m.search_memories([0.1] * 10, top_k=3)
+        params = cur.execute.call_args[0][1]
+        assert sum(isinstance(p, np.ndarray) for p in params) == 1
+
     def test_returns_list_of_dicts(self):
         from datetime import datetime
         mem_id = str(uuid.uuid4())
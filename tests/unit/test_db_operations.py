@@ -126,6 +126,8 @@ class TestDocumentOperations:
             docs = db_module.db.get_all_documents()
 
             assert len(docs) == 2
+            assert docs[0]['chunk_count'] == 10
+            assert 'document_chunks' not in mock_cursor.execute.call_args[0][0]
             assert docs[0]['filename'] == "doc1.pdf"
             assert docs[1]['filename'] == "doc2.txt"
 
@@ -250,7 +252,8 @@ class TestDocumentOperations:
             assert "UPDATE document_chunks" in args
             assert "deleted_at" in args
             assert "DELETE" not in args
-            assert params == (3,)
+            assert "chunk_count = 0" in args
+            assert params == (3, 3)
             mock_conn.commit.assert_called_once()
 
     def test_soft_delete_chunks_for_document_with_conn_does_not_commit(self):
@@ -290,6 +293,7 @@ class TestChunkOperations:
         ]
 
         mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [(1,), (2,), (3,)]
         mock_conn = MagicMock()
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
         mock_conn.cursor.return_value.__exit__.return_value = None
@@ -301,8 +305,59 @@ class TestChunkOperations:
 
             db_module.db.insert_chunks_batch(chunks_data)
 
-            # Verify cursor was used
-            assert mock_cursor.execute.called
+            # Rows stream through a single COPY; the pooled connection commits
+            copy = mock_cursor.copy.return_value.__enter__.return_value
+            assert copy.write_row.call_count == 3
+            mock_conn.commit.assert_called_once()
+
+    def test_insert_chunks_batch_copies_rows_with_preallocated_ids(self):
+        """Ids are drawn from the sequence in one query and written as the
+        first COPY column, in chunk order."""
+        import numpy as np
+
+        from src import db as db_module
+
+        chunks_data = [
+            (1, "chunk 1", 0, [0.1] * 768),
+            (1, "chunk 2", 1, [0.2] * 768),
+            (1, "chunk 3", 2, [0.3] * 768),
+        ]
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [(21,), (22,), (23,)]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_conn.cursor.return_value.__exit__.return_value = None
+
+        chunk_ids = db_module.db.insert_chunks_batch(chunks_data, conn=mock_conn)
+
+        assert chunk_ids == [21, 22, 23]
+        sql, params = mock_cursor.execute.call_args_list[0].args
+        assert 'nextval' in sql and params == (3,)
+        copy = mock_cursor.copy.return_value.__enter__.return_value
+        written = [c.args[0] for c in copy.write_row.call_args_list]
+        assert [(r[0], r[2], r[3]) for r in written] == [(21, "chunk 1", 0), (22, "chunk 2", 1), (23, "chunk 3", 2)]
+        assert written[0][4].dtype == np.float32
+
+    def test_insert_chunks_batch_bumps_chunk_count_per_document(self):
+        from src import db as db_module
+
+        chunks_data = [
+            (1, "a", 0, [0.1] * 768),
+            (2, "b", 0, [0.1] * 768),
+            (1, "c", 1, [0.1] * 768),
+        ]
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [(1,), (2,), (3,)]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        db_module.db.insert_chunks_batch(chunks_data, conn=mock_conn)
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert 'chunk_count = d.chunk_count + c.n' in sql
+        assert params == ([1, 2], [2, 1])
 
     def test_insert_chunks_batch_with_conn_does_not_commit_or_acquire_pool_connection(self):
         """When conn is supplied, insert_chunks_batch must use it directly and
@@ -426,6 +481,111 @@ class TestVectorSearch:
 
             assert results == []
 
+    def test_search_similar_chunks_binds_vector_once_and_prepares(self):
+        """The query vector is a single bound parameter, never inlined into the SQL."""
+        import numpy as np
+
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_conn.cursor.return_value.__exit__.return_value = None
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            mock_get_conn.return_value.__exit__.return_value = None
+
+            db_module.db.search_similar_chunks(query_embedding=[0.25] * 768, top_k=3)
+
+            (sql, params), kwargs = mock_cursor.execute.call_args
+            assert sql.count('%s::vector') == 1
+            assert '0.25' not in sql
+            assert isinstance(params[0], np.ndarray) and params[0].dtype == np.float32
+            assert kwargs == {'prepare': True}
+
+    def test_search_similar_chunks_file_type_filter_uses_indexed_extension(self):
+        """The file-type filter is an equality on documents.file_extension,
+        not a leading-wildcard LIKE on filename."""
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            db_module.db.search_similar_chunks(
+                query_embedding=[0.1] * 768, top_k=5, file_type_filter='.PDF'
+            )
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert 'd.file_extension = %s' in sql
+        assert 'LIKE' not in sql
+        assert params[1] == '.pdf'
+
+    def test_search_similar_chunks_skips_ef_search_for_default_top_k(self):
+        """top_k within the session ef_search issues only the search query."""
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            db_module.db.search_similar_chunks(query_embedding=[0.1] * 768, top_k=10)
+
+        assert mock_cursor.execute.call_count == 1
+
+    def test_search_similar_chunks_raises_ef_search_for_large_top_k(self):
+        """top_k above HNSW_EF_SEARCH gets a transaction-local set_config first."""
+        from src import config
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        top_k = config.HNSW_EF_SEARCH + 50
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            db_module.db.search_similar_chunks(query_embedding=[0.1] * 768, top_k=top_k)
+
+        # Searches run in autocommit, so the local override needs its own transaction
+        mock_conn.transaction.assert_called_once()
+        sql, params = mock_conn.execute.call_args[0]
+        assert "set_config('hnsw.ef_search', %s, true)" in sql
+        assert params == (str(top_k),)
+        assert mock_cursor.execute.call_count == 1
+
+    def test_search_similar_chunks_halfvec_index_reranks_candidates(self):
+        """With the halfvec index on, ANN orders by the FP16 expression and the
+        top_k * HALFVEC_RERANK_FACTOR candidates are re-ranked on FP32 similarity."""
+        from src import config
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(config, 'HNSW_HALFVEC_INDEX', True), \
+                patch.object(config, 'HALFVEC_RERANK_FACTOR', 4), \
+                patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            db_module.db.search_similar_chunks(query_embedding=[0.1] * 768, top_k=5)
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert 'ORDER BY dc.embedding::halfvec(768) <=> q.emb::halfvec(768)' in sql
+        assert 'ORDER BY similarity DESC' in sql
+        assert params[-2:] == [20, 5]
+
 
 class TestLexicalSearch:
     """Test the independent full-text lexical search arm (hybrid retrieval fix)."""
@@ -554,3 +714,47 @@ class TestDatabaseStats:
 
             assert doc_count == 5
             assert chunk_count == 100
+
+    def _count_with(self, rows, **kwargs):
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.side_effect = rows
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            count = db_module.db.get_chunk_count(**kwargs)
+        return count, [c.args[0] for c in mock_cursor.execute.call_args_list]
+
+    def test_scoped_count_filters_by_workspace(self):
+        count, statements = self._count_with([(3,)], workspace_id='ws-1')
+        assert count == 3
+        assert len(statements) == 1
+        assert 'COUNT(*)' in statements[0]
+
+    def _stats_with(self, row, **kwargs):
+        from src import db as db_module
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = row
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch.object(db_module.db, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            stats = db_module.db.get_database_stats(**kwargs)
+        return stats, mock_cursor.execute.call_args_list
+
+    def test_database_stats_fetches_both_counts_in_one_statement(self):
+        stats, calls = self._stats_with((4, 90), workspace_id='ws-1')
+        assert stats == {'document_count': 4, 'chunk_count': 90}
+        assert len(calls) == 1
+        assert calls[0].args[1] == ('ws-1', 'ws-1')
+
+    def test_unscoped_database_stats_are_exact_counts(self):
+        stats, calls = self._stats_with((4, 90))
+        assert stats == {'document_count': 4, 'chunk_count': 90}
+        assert calls[0].args[1] == ()
+        assert 'deleted_at IS NULL' in calls[0].args[0]
@@ -151,8 +151,9 @@ class TestDocumentUploadRoute:
 
 class TestDocumentStatsRoute:
     def test_stats_returns_counts(self, client, app):
-        app.state.db.get_document_count = MagicMock(return_value=3)
-        app.state.db.get_chunk_count = MagicMock(return_value=150)
+        app.state.db.get_database_stats = MagicMock(
+            return_value={'document_count': 3, 'chunk_count': 150}
+        )
         app.state.db.get_chunk_statistics = MagicMock(return_value={
             'avg_chunk_size': 512, 'min_chunk_size': 128, 'max_chunk_size': 1024
         })
@@ -163,34 +164,36 @@ class TestDocumentStatsRoute:
         assert data['chunk_count'] == 150
 
     def test_stats_with_zero_documents(self, client, app):
-        app.state.db.get_document_count = MagicMock(return_value=0)
-        app.state.db.get_chunk_count = MagicMock(return_value=0)
+        app.state.db.get_database_stats = MagicMock(
+            return_value={'document_count': 0, 'chunk_count': 0}
+        )
         app.state.db.get_chunk_statistics = MagicMock(return_value={})
         response = client.get('/api/documents/stats')
         assert response.status_code == 200
 
     def test_stats_db_unavailable_returns_503(self, client, app):
         from src.db import DatabaseUnavailableError
-        app.state.db.get_document_count = MagicMock(
+        app.state.db.get_database_stats = MagicMock(
             side_effect=DatabaseUnavailableError("not connected")
         )
         response = client.get('/api/documents/stats')
         assert response.status_code == 503
 
     def test_stats_passes_workspace_id_to_db(self, client, app):
-        app.state.db.get_document_count = MagicMock(return_value=2)
-        app.state.db.get_chunk_count = MagicMock(return_value=10)
+        app.state.db.get_database_stats = MagicMock(
+            return_value={'document_count': 2, 'chunk_count': 10}
+        )
         app.state.db.get_chunk_statistics = MagicMock(return_value={})
         client.get('/api/documents/stats', headers={'X-Workspace-ID': 'ws-abc'})
-        app.state.db.get_document_count.assert_called_once_with(workspace_id='ws-abc')
-        app.state.db.get_chunk_count.assert_called_once_with(workspace_id='ws-abc')
+        app.state.db.get_database_stats.assert_called_once_with(workspace_id='ws-abc')
 
     def test_stats_no_workspace_header_passes_none(self, client, app):
-        app.state.db.get_document_count = MagicMock(return_value=5)
-        app.state.db.get_chunk_count = MagicMock(return_value=25)
+        app.state.db.get_database_stats = MagicMock(
+            return_value={'document_count': 5, 'chunk_count': 25}
+        )
         app.state.db.get_chunk_statistics = MagicMock(return_value={})
         client.get('/api/documents/stats')
-        app.state.db.get_document_count.assert_called_once_with(workspace_id=None)
+        app.state.db.get_database_stats.assert_called_once_with(workspace_id=None)
 
 
 class TestDocumentSearchRoute:
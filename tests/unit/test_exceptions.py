@@ -65,6 +65,14 @@ class TestLocalChatException:
         assert result["message"] == "Test"
         assert result["details"] == {}
 
+    def test_construction_does_not_log(self):
+        """Should leave logging to the catch site."""
+        from unittest.mock import patch
+
+        with patch("src.exceptions.logger") as mock_logger:
+            LocalChatException("Test", details={"key": "value"})
+        assert mock_logger.method_calls == []
+
 
 # ============================================================================
 # OLLAMA EXCEPTION TESTS
@@ -363,6 +371,17 @@ class TestGetStatusCode:
         exc = LocalChatException("Unknown error")
         assert get_status_code(exc) == 500
 
+    def test_subclass_inherits_parent_status_code(self):
+        """Should map an unregistered subclass to its nearest registered parent."""
+        class EmptyQueryError(ValidationError):
+            pass
+
+        assert get_status_code(EmptyQueryError("Empty")) == 400
+
+    def test_returns_500_for_unrelated_exception(self):
+        """Should fall back to 500 for exceptions outside the hierarchy."""
+        assert get_status_code(KeyError("x")) == 500
+
 
 # ============================================================================
 # EXCEPTION CHAINING TESTS
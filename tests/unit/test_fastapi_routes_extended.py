@@ -46,6 +46,7 @@ class TestDocumentRoutesExtended:
         state.db.get_all_documents.return_value = [{"id": 1, "filename": "report.pdf"}]
         state.db.get_document_count.return_value = 1
         state.db.get_chunk_count.return_value = 10
+        state.db.get_database_stats.return_value = {"document_count": 1, "chunk_count": 10}
         state.db.get_chunk_statistics.return_value = {"avg_length": 400}
         state.db.delete_document.return_value = None
         state.db.delete_all_documents.return_value = None
@@ -83,6 +84,28 @@ class TestDocumentRoutesExtended:
         assert data["success"] is True
         assert data["count"] == 0
 
+    def test_search_text_omits_full_text_by_default(self):
+        client = self._client()
+        client.post("/api/documents/search-text", json={"search_text": "q", "limit": 100})
+        client.app.state.db.search_chunks_by_text.assert_called_once_with(
+            "q", 100, return_full_text=False,
+        )
+
+    def test_search_text_parses_full_text_flag(self):
+        client = self._client()
+        client.post("/api/documents/search-text", json={"search_text": "q", "full_text": "false"})
+        client.app.state.db.search_chunks_by_text.assert_called_once_with(
+            "q", 10, return_full_text=False,
+        )
+
+    def test_search_text_rejects_invalid_limit(self):
+        client = self._client()
+        for limit in (10_000, 0, -1, "ten"):
+            resp = client.post("/api/documents/search-text", json={"search_text": "q", "limit": limit})
+            assert resp.status_code == 400
+            assert resp.json()["message"] == "Invalid limit"
+        client.app.state.db.search_chunks_by_text.assert_not_called()
+
     def test_test_retrieval_no_query(self):
         client = self._client()
         resp = client.post("/api/documents/test", json={})
@@ -100,7 +123,7 @@ class TestDocumentRoutesExtended:
         from src.routes_fastapi.document_routes import router
 
         state = _base_state()
-        state.db.get_chunk_by_id.return_value = None
+        state.db.get_chunk_context.return_value = None
         client = _make_client(router, "/api/documents", state)
         resp = client.get("/api/documents/chunks/999/context")
         assert resp.status_code == 404
@@ -109,8 +132,9 @@ class TestDocumentRoutesExtended:
         from src.routes_fastapi.document_routes import router
 
         state = _base_state()
-        state.db.get_chunk_by_id.return_value = {"document_id": 1, "chunk_index": 2}
-        state.db.get_adjacent_chunks.return_value = [("chunk text", 2)]
+        state.db.get_chunk_context.return_value = {
+            "document_id": 1, "chunk_index": 2, "chunks": [("chunk text", 2)],
+        }
         client = _make_client(router, "/api/documents", state)
         resp = client.get("/api/documents/chunks/1/context")
         assert resp.status_code == 200
@@ -17,6 +17,7 @@ from __future__ import annotations
 import uuid
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 
 WS_A = "11111111-1111-1111-1111-111111111111"
@@ -40,12 +41,13 @@ def _memories_mixin(connected=True, fetchone_return=None, fetchall_return=None):
     m = MemoriesMixin()
     m.is_connected = connected
     m.get_connection = MagicMock(return_value=conn)
-    m._embedding_to_pg_array = MagicMock(return_value="[0.1,0.2]")
     return m, cur
 
 
 def _sql_and_params(cur):
     sql, params = cur.execute.call_args[0]
+    # Embeddings are bound as numpy arrays; mask them so `in` checks compare scalars.
+    params = tuple("<vector>" if isinstance(p, np.ndarray) else p for p in params)
     return " ".join(sql.split()), params
 
 
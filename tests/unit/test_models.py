@@ -79,6 +79,12 @@ class TestChatRequest:
         request = ChatRequest(message="Test", history=valid_history)
         assert len(request.history) == 2
 
+    def test_history_items_stay_plain_dicts(self):
+        """Should keep history items as role/content dicts, dropping UI-only keys."""
+        history = [{"role": "user", "content": "Hello", "timestamp": "2026-01-01T00:00:00Z"}]
+        request = ChatRequest(message="Test", history=history)
+        assert request.history == [{"role": "user", "content": "Hello"}]
+
     def test_rejects_invalid_history_format(self):
         """Should reject invalid history format."""
         invalid_history = [{"invalid": "format"}]
@@ -290,6 +296,11 @@ class TestRetrievalRequest:
         request = RetrievalRequest(query="test", file_type_filter=".pdf")
         assert request.file_type_filter == ".pdf"
 
+    def test_accepts_uppercase_file_type_filter(self):
+        """Should match file type filters case-insensitively, like the search does."""
+        request = RetrievalRequest(query="test", file_type_filter=".PDF")
+        assert request.file_type_filter == ".PDF"
+
     def test_rejects_file_type_without_dot(self):
         """Should reject file type filter without dot."""
         with pytest.raises(ValidationError):
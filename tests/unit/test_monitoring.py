@@ -100,6 +100,19 @@ class TestMetricsCollector:
         metrics = collector.get_metrics()
         assert len(metrics['counters']) >= 2
 
+    def test_label_key_independent_of_label_order(self):
+        """Test label order does not split a series, and unhashable values still work."""
+        from src.monitoring import MetricsCollector
+
+        collector = MetricsCollector()
+        collector.increment('hits', labels={'method': 'GET', 'status': 200})
+        collector.increment('hits', labels={'status': 200, 'method': 'GET'})
+        collector.increment('tags', labels={'ids': [1, 2]})
+
+        counters = collector.get_metrics()['counters']
+        assert counters['hits{method="GET",status="200"}'] == 2
+        assert counters['tags{ids="[1, 2]"}'] == 1
+
     def test_record_histogram_value(self):
         """Test recording histogram values."""
         from src.monitoring import MetricsCollector
@@ -122,9 +135,29 @@ class TestMetricsCollector:
         for i in range(1500):
             collector.record('test_metric', float(i))
 
-        # Should limit storage
-        metrics = collector.get_metrics()
-        assert metrics is not None
+        # Should limit storage to the most recent 1000; totals stay lifetime
+        window = collector.get_histogram_values()['test_metric']
+        assert len(window) == 1000 and window[0] == 500.0
+        hist = collector.get_metrics()['histograms']['test_metric']
+        assert hist['count'] == 1500
+        assert hist['min'] == 0.0 and hist['max'] == 1499.0
+        assert hist['p50'] == 1000.0
+
+    def test_percentiles_nearest_rank_on_unsorted_values(self):
+        """Test percentiles match sorted nearest-rank lookup for shuffled input."""
+        import random
+
+        from src.monitoring import MetricsCollector
+
+        collector = MetricsCollector()
+        values = [float(i) for i in range(1, 101)]
+        random.Random(7).shuffle(values)
+        for v in values:
+            collector.record('latency', v)
+
+        hist = collector.get_metrics()['histograms']['latency']
+        assert (hist['p50'], hist['p95'], hist['p99']) == (51.0, 96.0, 100.0)
+        assert isinstance(hist['p50'], float)
 
     def test_set_gauge_value(self):
         """Test setting gauge values."""
@@ -431,7 +464,7 @@ class TestTimedSlowOperation:
         def my_func():
             return 'ok'
 
-        with patch('src.monitoring.time', side_effect=[0.0, 2.0]):
+        with patch('src.monitoring.perf_counter', side_effect=[0.0, 2.0]):
             with patch('src.monitoring.logger') as mock_logger:
                 result = my_func()
 
@@ -449,7 +482,7 @@ class TestTimedSlowOperation:
         def my_func():
             return 'ok'
 
-        with patch('src.monitoring.time', side_effect=[0.0, 0.1]):
+        with patch('src.monitoring.perf_counter', side_effect=[0.0, 0.1]):
             with patch('src.monitoring.logger') as mock_logger:
                 my_func()
 
@@ -214,6 +214,92 @@ class TestRunRetrievalPipelineThreshold:
         assert "weak.pdf:0" not in filtered
         assert filtered == {}
 
+    def test_lexical_arm_runs_concurrently_with_semantic_arm(self, retriever):
+        """The semantic search waits for the lexical search to start; run
+        sequentially (semantic first) this would time out."""
+        import threading
+
+        lexical_started = threading.Event()
+
+        def _semantic(*_args, **_kwargs):
+            assert lexical_started.wait(timeout=5)
+            return [_semantic_row("a.pdf", 0, 0.9, chunk_id=1)]
+
+        def _lexical(*_args, **_kwargs):
+            lexical_started.set()
+            return [_lexical_row("b.pdf", 0, 0.9, chunk_id=2)]
+
+        retriever._db = MagicMock()
+        retriever._db.search_similar_chunks.side_effect = _semantic
+        retriever._db.search_lexical_chunks.side_effect = _lexical
+
+        filtered = retriever._run_retrieval_pipeline(
+            query_clean="query",
+            query_embedding=[0.0] * 768,
+            top_k=5,
+            min_similarity=0.30,
+            file_type_filter=None,
+            use_hybrid_search=True,
+        )
+
+        assert {"a.pdf:0", "b.pdf:0"} <= set(filtered)
+
+    def test_lexical_arm_sees_callers_request_id(self, retriever):
+        """contextvars are copied into the executor thread, so log lines from
+        the lexical arm carry the request ID."""
+        from src.utils.request_id import request_id_var
+
+        seen = []
+
+        def _lexical(*_args, **_kwargs):
+            seen.append(request_id_var.get())
+            return []
+
+        retriever._db = MagicMock()
+        retriever._db.search_similar_chunks.return_value = []
+        retriever._db.search_lexical_chunks.side_effect = _lexical
+
+        token = request_id_var.set("req-123")
+        try:
+            retriever._run_retrieval_pipeline(
+                query_clean="query",
+                query_embedding=[0.0] * 768,
+                top_k=5,
+                min_similarity=0.30,
+                file_type_filter=None,
+                use_hybrid_search=True,
+            )
+        finally:
+            request_id_var.reset(token)
+
+        assert seen == ["req-123"]
+
+    def test_additional_workspaces_search_concurrently_with_primary(self, retriever):
+        """The primary workspace search waits for the additional workspace's
+        search to start; queued behind it, this would time out."""
+        import threading
+
+        extra_started = threading.Event()
+
+        def _pipeline(*_args, workspace_id=None, **_kwargs):
+            if workspace_id == "ws-a":
+                assert extra_started.wait(timeout=5)
+                return {"a.pdf:0": _result("a.pdf", 0)}
+            extra_started.set()
+            return {"b.pdf:0": _result("b.pdf", 0)}
+
+        retriever._ollama_client = MagicMock()
+        retriever._ollama_client.get_embedding_model.return_value = "embed"
+        with patch.object(retriever, "_get_app_cache", return_value=None), \
+                patch.object(retriever, "_get_cached_embedding", return_value=[0.0] * 768), \
+                patch.object(retriever, "_run_retrieval_pipeline", side_effect=_pipeline), \
+                patch.object(retriever, "_rank_and_finalize", side_effect=lambda _q, r: sorted(r)):
+            output = retriever.retrieve_context(
+                "query", workspace_id="ws-a", additional_workspace_ids=["ws-b"],
+            )
+
+        assert output == ["a.pdf:0", "b.pdf:0"]
+
 
 # ---------------------------------------------------------------------------
 # _deduplicate_results
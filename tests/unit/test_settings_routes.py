@@ -36,8 +36,7 @@ class TestCollectDocumentStats:
         from src.routes_fastapi.settings_routes import _collect_document_stats
 
         app = Mock()
-        app.db.get_document_count.return_value = 5
-        app.db.get_chunk_count.return_value = 42
+        app.db.get_database_stats.return_value = {"document_count": 5, "chunk_count": 42}
 
         result = _collect_document_stats(app)
 
@@ -50,7 +49,7 @@ class TestCollectDocumentStats:
         from src.routes_fastapi.settings_routes import _collect_document_stats
 
         app = Mock()
-        app.db.get_document_count.side_effect = Exception("DB error")
+        app.db.get_database_stats.side_effect = Exception("DB error")
 
         result = _collect_document_stats(app)
 
@@ -18,7 +18,7 @@ class _FakeDB(TokensMixin):
         self._rows = cursor_rows or []
         self._rowcount = rowcount
 
-    def get_connection(self):
+    def get_connection(self, read_only=False):
         from contextlib import contextmanager
 
         cur = MagicMock()
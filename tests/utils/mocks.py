@@ -84,6 +84,10 @@ class MockDatabase:
         """Get chunk count."""
         return len(self.chunks)
 
+    def get_database_stats(self, workspace_id: str | None = None) -> dict:
+        """Get document and chunk counts together."""
+        return {'document_count': len(self.documents), 'chunk_count': len(self.chunks)}
+
     def get_all_documents(self) -> list[dict]:
         """Get all documents."""
         return list(self.documents.values())